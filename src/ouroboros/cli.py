@@ -1,13 +1,25 @@
 import argparse
 import json
 import logging
-from .config import SafetyConfig
-from .policies import require_pr_only
-from .moltbook import run_loop, get_status, get_feed, load_credentials
-from .self_modify import get_current_config, modify_runner_config, can_self_modify
+
+_LOGGING_READY = False
+
+
+def _setup_logging() -> None:
+    global _LOGGING_READY
+    if _LOGGING_READY:
+        return
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    _LOGGING_READY = True
 
 
 def cmd_plan(_args: argparse.Namespace) -> int:
+    from .config import SafetyConfig
+
     config = SafetyConfig()
     mode = "AUTONOMOUS" if not config.require_human_approval else "SUPERVISED"
     writes = "direct writes enabled" if config.allow_write_default_branch else "PR-only"
@@ -17,6 +29,9 @@ def cmd_plan(_args: argparse.Namespace) -> int:
 
 
 def cmd_propose(_args: argparse.Namespace) -> int:
+    from .config import SafetyConfig
+    from .policies import require_pr_only
+
     config = SafetyConfig()
     if config.pr_only:
         require_pr_only(config.pr_only)
@@ -25,6 +40,9 @@ def cmd_propose(_args: argparse.Namespace) -> int:
 
 
 def cmd_apply(_args: argparse.Namespace) -> int:
+    from .config import SafetyConfig
+    from .policies import require_pr_only
+
     config = SafetyConfig()
     if config.pr_only:
         require_pr_only(config.pr_only)
@@ -42,15 +60,15 @@ def cmd_apply(_args: argparse.Namespace) -> int:
 
 
 def cmd_moltbook_run(_args: argparse.Namespace) -> int:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    _setup_logging()
+    from .moltbook import run_loop
+
     return run_loop()
 
 
 def cmd_moltbook_status(_args: argparse.Namespace) -> int:
+    from .moltbook import get_status, load_credentials
+
     creds = load_credentials()
     status = get_status(creds.api_key)
     print(status)
@@ -58,6 +76,8 @@ def cmd_moltbook_status(_args: argparse.Namespace) -> int:
 
 
 def cmd_moltbook_feed(args: argparse.Namespace) -> int:
+    from .moltbook import get_feed, load_credentials
+
     creds = load_credentials()
     feed = get_feed(creds.api_key, sort=args.sort, limit=args.limit)
     print(feed)
@@ -65,31 +85,40 @@ def cmd_moltbook_feed(args: argparse.Namespace) -> int:
 
 
 def cmd_config_show(_args: argparse.Namespace) -> int:
+    from .self_modify import get_current_config
+
     config = get_current_config()
     print(json.dumps(config, indent=2))
     return 0
 
 
 def cmd_config_modify(args: argparse.Namespace) -> int:
+    from .self_modify import can_self_modify, modify_runner_config
+
     if not can_self_modify():
         print("Self-modification is disabled. Set allow_self_modification=True in SafetyConfig.")
         return 2
 
     updates = {}
     for kv in args.updates:
-        if "=" not in kv:
+        key, sep, value = kv.partition("=")
+        if not sep:
             print(f"Invalid update format: {kv}. Use key=value")
             return 1
-        key, value = kv.split("=", 1)
         # Parse value
-        if value.lower() == "true":
+        low = value.lower()
+        if low == "true":
             updates[key] = True
-        elif value.lower() == "false":
+        elif low == "false":
             updates[key] = False
-        elif value.isdigit():
-            updates[key] = int(value)
         else:
-            updates[key] = value
+            try:
+                updates[key] = int(value)
+            except ValueError:
+                try:
+                    updates[key] = float(value)
+                except ValueError:
+                    updates[key] = value
 
     modify_runner_config(updates)
     print(f"Updated runner config: {updates}")
@@ -100,11 +129,7 @@ def cmd_config_modify(args: argparse.Namespace) -> int:
 
 def cmd_improve_run(args: argparse.Namespace) -> int:
     """Run one improvement cycle."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    _setup_logging()
     from . import llm
     from .improvement import run_improvement_cycle
     from .config import SafetyConfig
@@ -186,15 +211,13 @@ def cmd_improve_history(_args: argparse.Namespace) -> int:
 
 def cmd_improve_community(args: argparse.Namespace) -> int:
     """Run one community improvement step (or full dry-run cycle)."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    _setup_logging()
+    from dataclasses import replace
+
     from . import llm
     from .community_improvement import step_community_improvement, clear_community_improvement
     from .config import SafetyConfig
-    from .moltbook import load_credentials, load_runner_config, load_state, save_state, RunnerConfig
+    from .moltbook import load_credentials, load_runner_config, load_state, save_state
 
     openai_key = llm.load_openai_key()
     client = llm.make_client(openai_key)
@@ -202,13 +225,11 @@ def cmd_improve_community(args: argparse.Namespace) -> int:
 
     cfg = load_runner_config()
     # Force community improvement on and apply CLI flags
-    cfg = RunnerConfig(
-        **{
-            **{f.name: getattr(cfg, f.name) for f in cfg.__dataclass_fields__.values()},
-            "enable_community_improvement": True,
-            "dry_run": getattr(args, "dry_run", False),
-            "improvement_model": getattr(args, "model", "gpt-4o"),
-        }
+    cfg = replace(
+        cfg,
+        enable_community_improvement=True,
+        dry_run=getattr(args, "dry_run", False),
+        improvement_model=getattr(args, "model", "gpt-4o"),
     )
 
     creds = load_credentials()
@@ -238,11 +259,7 @@ def cmd_improve_community(args: argparse.Namespace) -> int:
 
 def cmd_improve_identify(args: argparse.Namespace) -> int:
     """Dry-run: identify improvements without acting."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    _setup_logging()
     from . import llm
     from .improvement import run_improvement_cycle
     from .config import SafetyConfig
@@ -268,19 +285,22 @@ def cmd_improve_identify(args: argparse.Namespace) -> int:
     return 0
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="ouroboros")
-    sub = parser.add_subparsers(dest="command", required=True)
-
+def _add_plan(sub) -> None:
     p_plan = sub.add_parser("plan", help="Show current safety and workflow plan")
     p_plan.set_defaults(func=cmd_plan)
 
+
+def _add_propose(sub) -> None:
     p_prop = sub.add_parser("propose", help="Generate a proposal from a question")
     p_prop.set_defaults(func=cmd_propose)
 
+
+def _add_apply(sub) -> None:
     p_apply = sub.add_parser("apply", help="Apply proposal as a PR (gated)")
     p_apply.set_defaults(func=cmd_apply)
 
+
+def _add_moltbook(sub) -> None:
     p_mb = sub.add_parser("moltbook", help="Moltbook tools")
     mb_sub = p_mb.add_subparsers(dest="mb_command", required=True)
 
@@ -295,6 +315,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_feed.add_argument("--limit", type=int, default=10)
     p_feed.set_defaults(func=cmd_moltbook_feed)
 
+
+def _add_config(sub) -> None:
     p_cfg = sub.add_parser("config", help="Manage agent configuration")
     cfg_sub = p_cfg.add_subparsers(dest="cfg_command", required=True)
 
@@ -305,7 +327,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_modify.add_argument("updates", nargs="+", help="key=value pairs to update")
     p_modify.set_defaults(func=cmd_config_modify)
 
-    # -- improve subcommand --
+
+def _add_improve(sub) -> None:
     p_improve = sub.add_parser("improve", help="Self-improvement tools")
     imp_sub = p_improve.add_subparsers(dest="imp_command", required=True)
 
@@ -329,11 +352,47 @@ def build_parser() -> argparse.ArgumentParser:
     p_imp_community.add_argument("--dry-run", action="store_true", help="Identify and generate post, don't publish")
     p_imp_community.set_defaults(func=cmd_improve_community)
 
+
+_SUBCOMMANDS = {
+    "plan": _add_plan,
+    "propose": _add_propose,
+    "apply": _add_apply,
+    "moltbook": _add_moltbook,
+    "config": _add_config,
+    "improve": _add_improve,
+}
+
+
+def build_parser_for(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the parser, constructing only the matched subparser when possible.
+
+    argparse subparser construction is the dominant startup cost for CLIs
+    with many subcommands; when `command` names a known subcommand, only
+    that subtree is built. For `-h`/unknown commands the full parser is
+    built so help and "invalid choice" messages still enumerate everything.
+    """
+    parser = argparse.ArgumentParser(prog="ouroboros")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    adder = _SUBCOMMANDS.get(command) if command else None
+    if adder is not None:
+        adder(sub)
+    else:
+        for add in _SUBCOMMANDS.values():
+            add(sub)
+
     return parser
 
 
+def build_parser() -> argparse.ArgumentParser:
+    return build_parser_for(None)
+
+
 def main() -> int:
-    parser = build_parser()
+    import sys
+
+    cmd = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith("-") else None
+    parser = build_parser_for(cmd)
     args = parser.parse_args()
     return args.func(args)
 
@@ -1,16 +1,28 @@
 """Codebase self-reader -- lets the agent inspect its own source code."""
 
 import ast
+import hashlib
+import itertools
+import json
 import logging
+import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple
 
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_repo_root() -> Path:
     """Return the git repository root directory."""
+    here = Path(__file__).resolve()
+    for parent in here.parents:
+        if (parent / ".git").exists():
+            return parent
+
+    # Last resort (e.g. submodule layouts where .git isn't a sibling dir)
     try:
         out = subprocess.check_output(
             ["git", "rev-parse", "--show-toplevel"],
@@ -21,21 +33,33 @@ def get_repo_root() -> Path:
             return Path(out)
     except Exception:
         pass
-
-    here = Path(__file__).resolve()
-    for parent in here.parents:
-        if (parent / ".git").exists():
-            return parent
     return here.parents[2]
 
 
+_SKIP_DIRS = {"__pycache__", ".git", ".venv", ".pytest_cache", "node_modules"}
+
+
+def _walk_py(root: Path):
+    """Yield .py files under root, skipping cache/vendor dirs.
+
+    DirEntry.is_dir reads from the readdir buffer, so this avoids the extra
+    stat() per entry that rglob pays.
+    """
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in _SKIP_DIRS:
+                yield from _walk_py(Path(entry.path))
+        elif entry.name.endswith(".py"):
+            yield Path(entry.path)
+
+
 def list_source_files(repo_root: Path | None = None) -> List[Path]:
     """Return all .py files under src/ouroboros/."""
     root = repo_root or get_repo_root()
     src_dir = root / "src" / "ouroboros"
     if not src_dir.exists():
         return []
-    return sorted(src_dir.rglob("*.py"))
+    return sorted(_walk_py(src_dir))
 
 
 def get_test_files(repo_root: Path | None = None) -> List[Path]:
@@ -44,103 +68,251 @@ def get_test_files(repo_root: Path | None = None) -> List[Path]:
     test_dir = root / "tests"
     if not test_dir.exists():
         return []
-    return sorted(test_dir.rglob("*.py"))
+    return sorted(_walk_py(test_dir))
 
 
-def read_file(path: Path) -> str:
-    """Read file contents with line numbers prepended."""
+def read_file(path: Path, max_lines: int | None = None) -> str:
+    """Read file contents with line numbers prepended.
+
+    Pass `max_lines` to truncate long files early (e.g. for LLM context).
+    """
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
-    lines = path.read_text(encoding="utf-8").splitlines()
-    numbered = [f"{i + 1:4d} | {line}" for i, line in enumerate(lines)]
-    return "\n".join(numbered)
+    lines = iter(path.read_text(encoding="utf-8").splitlines())
+    if max_lines is not None:
+        lines = itertools.islice(lines, max_lines)
+    return "\n".join(f"{i:4d} | {line}" for i, line in enumerate(lines, 1))
 
 
 def read_file_raw(path: Path) -> str:
-    """Read file contents without line numbers."""
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+    """Read file contents without line numbers.
+
+    EAFP: open directly and let a missing file raise FileNotFoundError,
+    saving the pre-check stat on the (common) hit path.
+    """
     return path.read_text(encoding="utf-8")
 
 
-def get_function_signatures(path: Path) -> List[Dict[str, Any]]:
+def read_file_prefix(path: Path, max_chars: int) -> str:
+    """Read at most `max_chars` of a file, marking truncation.
+
+    Unlike read-then-slice, this never materialises more than the prefix,
+    so a multi-megabyte file costs only the bytes kept. Missing files
+    raise FileNotFoundError from the open itself (no pre-check stat).
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        data = f.read(max_chars + 1)
+    if len(data) > max_chars:
+        return data[:max_chars] + "\n# ... (truncated)"
+    return data
+
+
+class Signature(NamedTuple):
+    """One function/method signature; a NamedTuple keeps per-entry memory small."""
+
+    name: str
+    args: tuple[str, ...]
+    line: int
+    kind: str  # 'function' or 'method'
+    cls: str | None = None
+
+
+def get_function_signatures(path: Path, source: str | None = None) -> List[Signature]:
     """Extract function/method signatures using AST parsing.
 
-    Returns list of dicts with keys: name, args, line, type ('function' or 'method'),
-    and optionally 'class' for methods.
+    Returns a list of Signature tuples; `cls` is set for methods. Pass
+    `source` to skip re-reading the file.
     """
-    source = path.read_text(encoding="utf-8")
+    if source is None:
+        source = path.read_text(encoding="utf-8")
     try:
         tree = ast.parse(source, filename=str(path))
     except SyntaxError:
         log.warning("Failed to parse %s", path)
         return []
 
-    signatures = []
+    signatures: List[Signature] = []
+
+    def visit(node: ast.AST, class_name: str | None) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.FunctionDef | ast.AsyncFunctionDef):
+                signatures.append(
+                    Signature(
+                        name=child.name,
+                        args=tuple(arg.arg for arg in child.args.args),
+                        line=child.lineno,
+                        kind="method" if class_name else "function",
+                        cls=class_name,
+                    )
+                )
+                # Defs nested inside a function are plain functions, not methods
+                visit(child, None)
+            elif isinstance(child, ast.ClassDef):
+                visit(child, child.name)
+            else:
+                visit(child, class_name)
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            args = []
-            for arg in node.args.args:
-                args.append(arg.arg)
+    visit(tree, None)
+    return signatures
 
-            sig: Dict[str, Any] = {
-                "name": node.name,
-                "args": args,
-                "line": node.lineno,
-                "type": "function",
-            }
 
-            # Check if this is a method (parent is a ClassDef)
-            for parent_node in ast.walk(tree):
-                if isinstance(parent_node, ast.ClassDef):
-                    for child in ast.iter_child_nodes(parent_node):
-                        if child is node:
-                            sig["type"] = "method"
-                            sig["class"] = parent_node.name
-                            break
+def _count_lines(source: str) -> int:
+    """Count lines without materializing a list of them (matches splitlines)."""
+    count = source.count("\n")
+    if source and not source.endswith("\n"):
+        count += 1
+    return count
 
-            signatures.append(sig)
 
-    return signatures
+def _parse_one(path: Path) -> tuple[int, List[Signature]]:
+    """Read and parse one file; picklable worker for the process pool."""
+    src = path.read_text(encoding="utf-8")
+    return _count_lines(src), get_function_signatures(path, source=src)
+
+
+# Below this many files the pool startup cost outweighs the parallel parse.
+_PARALLEL_THRESHOLD = 8
+
+
+def _sig_cache_path(root: Path) -> Path:
+    return root / ".ouroboros" / "cache" / "sigs.json"
+
+
+def _cache_key(path: Path) -> str | None:
+    """Cache key from mtime+size; cheaper than hashing content on the fast path."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _load_sig_cache(root: Path) -> Dict[str, Any]:
+    try:
+        with open(_sig_cache_path(root), encoding="utf-8") as fh:
+            cache = json.load(fh)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_sig_cache(root: Path, cache: Dict[str, Any]) -> None:
+    cache_path = _sig_cache_path(root)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except OSError:
+        log.debug("Could not write signature cache at %s", cache_path)
+
+
+def _parse_uncached(files: List[Path]) -> Dict[Path, tuple[int, List[Signature]]]:
+    """Parse files, in parallel across processes when there are enough of them."""
+    if len(files) < _PARALLEL_THRESHOLD:
+        return {f: _parse_one(f) for f in files}
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        with ProcessPoolExecutor() as ex:
+            return dict(zip(files, ex.map(_parse_one, files, chunksize=8)))
+    except Exception:
+        # Pools can be unavailable (restricted environments); parse serially.
+        return {f: _parse_one(f) for f in files}
+
+
+def _parse_files(files: List[Path], root: Path) -> Dict[Path, tuple[int, List[Signature]]]:
+    """Parse files, reusing signatures cached on disk for unchanged files."""
+    cache = _load_sig_cache(root)
+    results: Dict[Path, tuple[int, List[Signature]]] = {}
+    keys = {f: _cache_key(f) for f in files}
+
+    misses = []
+    for f in files:
+        hit = cache.get(keys[f]) if keys[f] else None
+        if hit is not None:
+            # JSON round-trips the Signature tuples as plain lists
+            sigs = [Signature(s[0], tuple(s[1]), s[2], s[3], s[4]) for s in hit["sigs"]]
+            results[f] = (hit["line_count"], sigs)
+        else:
+            misses.append(f)
+
+    if misses:
+        parsed = _parse_uncached(misses)
+        results.update(parsed)
+        fresh = {
+            keys[f]: {"line_count": line_count, "sigs": sigs}
+            for f, (line_count, sigs) in parsed.items()
+            if keys[f]
+        }
+        _save_sig_cache(root, {**fresh, **{k: v for k, v in cache.items() if k in keys.values()}})
+
+    return results
+
+
+def _format_sig(sig: Signature, include_class: bool) -> str:
+    prefix = f"  {sig.cls}." if include_class and sig.cls else "  "
+    return f"{prefix}{sig.name}({', '.join(sig.args)}) [line {sig.line}]"
+
+
+# (fingerprint, summary) one-slot memo; the fingerprint covers HEAD plus
+# worktree status, so unchanged trees skip the walk and reassembly.
+_summary_memo: tuple[str, str] | None = None
+
+
+def _tree_fingerprint(root: Path) -> str | None:
+    """Hash HEAD + porcelain status; None (no caching) if git fails."""
+    try:
+        head = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=root, stderr=subprocess.DEVNULL
+        )
+        status = subprocess.check_output(
+            ["git", "status", "--porcelain"], cwd=root, stderr=subprocess.DEVNULL
+        )
+    except Exception:
+        return None
+    return hashlib.blake2b(head + status, digest_size=16).hexdigest()
 
 
 def get_codebase_summary(repo_root: Path | None = None) -> str:
     """Build an LLM-consumable summary of all source modules.
 
     Includes module names, classes, functions with signatures, and line counts.
+    Memoized on a git tree fingerprint: the improvement loop rebuilds this
+    every cycle, but most cycles see an unchanged tree.
     """
+    global _summary_memo
     root = repo_root or get_repo_root()
+    fingerprint = _tree_fingerprint(root)
+    if fingerprint and _summary_memo and _summary_memo[0] == fingerprint:
+        return _summary_memo[1]
     src_files = list_source_files(root)
     test_files = get_test_files(root)
+    parsed = _parse_files(src_files + test_files, root)
 
     parts = ["# Codebase Summary\n"]
     parts.append("## Source Files (src/ouroboros/)\n")
 
     for f in src_files:
         rel = f.relative_to(root)
-        line_count = len(f.read_text(encoding="utf-8").splitlines())
+        line_count, sigs = parsed[f]
         parts.append(f"### {rel} ({line_count} lines)")
 
-        sigs = get_function_signatures(f)
         if sigs:
-            for sig in sigs:
-                prefix = f"  {sig['class']}." if sig.get("class") else "  "
-                args_str = ", ".join(sig["args"])
-                parts.append(f"{prefix}{sig['name']}({args_str}) [line {sig['line']}]")
+            parts.append("\n".join(_format_sig(sig, include_class=True) for sig in sigs))
         parts.append("")
 
     parts.append("## Test Files (tests/)\n")
     for f in test_files:
         rel = f.relative_to(root)
-        line_count = len(f.read_text(encoding="utf-8").splitlines())
+        line_count, sigs = parsed[f]
         parts.append(f"### {rel} ({line_count} lines)")
 
-        sigs = get_function_signatures(f)
         if sigs:
-            for sig in sigs:
-                args_str = ", ".join(sig["args"])
-                parts.append(f"  {sig['name']}({args_str}) [line {sig['line']}]")
+            parts.append("\n".join(_format_sig(sig, include_class=False) for sig in sigs))
         parts.append("")
 
-    return "\n".join(parts)
+    summary = "\n".join(parts)
+    if fingerprint:
+        _summary_memo = (fingerprint, summary)
+    return summary
@@ -6,13 +6,17 @@ Flow:
                                        fallback       failed/reverted
 """
 
+import asyncio
+import io
 import logging
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
 
 from . import git_ops, llm, moltbook
-from .codebase import get_codebase_summary, get_repo_root, read_file_raw
+from .codebase import get_codebase_summary, get_repo_root, read_file_prefix, read_file_raw
 from .config import SafetyConfig
 from .evaluation import load_history, summarize_history
 from .improvement import (
@@ -31,7 +35,86 @@ log = logging.getLogger(__name__)
 MAX_CODE_CONTEXT_CHARS = 3000
 MAX_COMMUNITY_HISTORY = 20
 
-STATUSES = ("identified", "posted", "waiting", "analyzing", "implementing", "completed", "fallback", "failed")
+IDENTIFY_CACHE_FILE = ".ouroboros/identify-cache.json"
+MAX_IDENTIFY_CACHE_ENTRIES = 10
+
+STATUSES = ("identified", "posted", "waiting", "analyzing", "implementing", "pushing", "completed", "fallback", "failed")
+
+# Single-flight worker for push + PR creation: the slow network half of
+# _step_implement runs here while the orchestrator keeps cycling. Futures
+# are keyed by task_id because the state dict must stay JSON-serializable.
+_PR_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ouroboros-pr")
+_pr_futures: Dict[str, "Future[str]"] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class _ResolvedCfg:
+    """Snapshot of the community settings resolved from RunnerConfig.
+
+    Built once per orchestrator cycle so the step functions read plain
+    attributes instead of repeating getattr-with-default lookups, and so
+    the effective values are explicit in one place.
+    """
+
+    interval_s: int
+    wait_s: int
+    min_comments: int
+    post_interval_s: float
+    poll_interval_s: int
+    model: str
+    dry_run: bool
+    default_submolt: str
+
+    @classmethod
+    def from_runner(cls, cfg: Any) -> "_ResolvedCfg":
+        if isinstance(cfg, cls):
+            return cfg
+        return cls(
+            interval_s=getattr(cfg, "community_improvement_interval_hours", 72) * 3600,
+            wait_s=getattr(cfg, "community_wait_hours", 48) * 3600,
+            min_comments=getattr(cfg, "community_min_comments_for_early", 3),
+            post_interval_s=getattr(cfg, "community_post_interval_hours", 1.0) * 3600,
+            poll_interval_s=getattr(cfg, "community_poll_interval_seconds", 300),
+            model=getattr(cfg, "improvement_model", "gpt-4o"),
+            dry_run=cfg.dry_run,
+            default_submolt=cfg.default_submolt,
+        )
+
+
+def _task_payload(ci: Dict[str, Any]) -> Dict[str, Any]:
+    """Canonical dict form of the current task, as the llm helpers expect it."""
+    return {
+        "task_type": ci["task_type"],
+        "description": ci["description"],
+        "target_files": ci["target_files"],
+        "evidence": ci["evidence"],
+    }
+
+
+def _safe_read(path, max_chars: Optional[int] = None) -> str:
+    """Read a file, returning "" if missing; truncate inside the worker.
+
+    EAFP: one open per hit instead of a stat pre-check plus an open.
+    """
+    try:
+        if max_chars is not None:
+            # Stream-truncate: never materialise more than the prefix we keep.
+            return read_file_prefix(path, max_chars)
+        return read_file_raw(path)
+    except FileNotFoundError:
+        return ""
+
+
+def _read_target_files(
+    repo_root, target_files: List[str], max_chars: Optional[int] = None
+) -> Dict[str, str]:
+    """Read target files concurrently; stat+read latency overlaps across files."""
+    if not target_files:
+        return {}
+    paths = [repo_root / p for p in target_files]
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as ex:
+        contents = ex.map(lambda p: _safe_read(p, max_chars), paths)
+        return dict(zip(target_files, contents))
 
 
 def step_community_improvement(
@@ -49,13 +132,13 @@ def step_community_improvement(
     Returns a short status string for logging, or None if nothing happened.
     """
     ci = state.get("community_improvement")
+    rcfg = _ResolvedCfg.from_runner(cfg)
 
     if ci is None:
         # Check interval
         last_start = state.get("last_community_improvement_start")
         now = int(time.time())
-        interval = getattr(cfg, "community_improvement_interval_hours", 72)
-        if last_start is not None and (now - int(last_start)) < interval * 3600:
+        if last_start is not None and (now - int(last_start)) < rcfg.interval_s:
             return None
 
         # Check no open PRs
@@ -64,29 +147,103 @@ def step_community_improvement(
             log.debug("[community] Skipping: open improvement PRs exist")
             return None
 
-        return _step_identify(client, state, cfg, safety_config)
+        return _step_identify(client, state, rcfg, safety_config)
 
     status = ci.get("status")
-    if status == "identified":
-        return _step_post(client, state, creds, cfg)
-    elif status == "posted":
-        return _step_wait(state, creds, cfg)
-    elif status == "waiting":
-        return _step_wait(state, creds, cfg)
-    elif status == "analyzing":
-        return _step_analyze(client, state, cfg)
-    elif status == "implementing":
-        return _step_implement(client, state, creds, cfg, safety_config)
-    elif status in ("completed", "failed"):
+    if status in ("completed", "failed"):
         # Should have been cleared already, but clear now
         clear_community_improvement(state)
         return f"cleared ({status})"
-    elif status == "fallback":
-        return _step_implement(client, state, creds, cfg, safety_config)
-    else:
+
+    handler = _STATUS_HANDLERS.get(status)
+    if handler is None:
         log.warning("[community] Unknown status: %s, clearing", status)
         clear_community_improvement(state)
         return None
+    return handler(client, state, creds, rcfg, safety_config)
+
+
+# Jump table for the non-terminal states above; each entry adapts the shared
+# (client, state, creds, cfg, safety_config) call to the step's signature.
+# The lambdas resolve _step_* through the module namespace at call time.
+_STATUS_HANDLERS: Dict[str, Callable[..., Optional[str]]] = {
+    "identified": lambda client, state, creds, cfg, safety: _step_post(client, state, creds, cfg),
+    "posted": lambda client, state, creds, cfg, safety: _step_wait(state, creds, cfg),
+    "waiting": lambda client, state, creds, cfg, safety: _step_wait(state, creds, cfg),
+    "analyzing": lambda client, state, creds, cfg, safety: _step_analyze(client, state, cfg),
+    "implementing": lambda client, state, creds, cfg, safety: _step_implement(client, state, creds, cfg, safety),
+    "pushing": lambda client, state, creds, cfg, safety: _step_pushing(state),
+    "fallback": lambda client, state, creds, cfg, safety: _step_implement(client, state, creds, cfg, safety),
+}
+
+
+def _tree_state_key(repo_root, model: str) -> Optional[str]:
+    """Hash HEAD + worktree status + model into an identify-cache key.
+
+    Returns None when the git state can't be read, which disables caching.
+    """
+    import hashlib
+    import subprocess
+
+    try:
+        head = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=repo_root, stderr=subprocess.DEVNULL
+        )
+        status = subprocess.check_output(
+            ["git", "status", "--porcelain"], cwd=repo_root, stderr=subprocess.DEVNULL
+        )
+    except Exception:
+        return None
+    return hashlib.blake2b(head + status + model.encode(), digest_size=16).hexdigest()
+
+
+def _identify_cache_load(repo_root) -> Dict[str, Any]:
+    import json
+
+    try:
+        with open(repo_root / IDENTIFY_CACHE_FILE, encoding="utf-8") as fh:
+            cache = json.load(fh)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _identify_cache_store(repo_root, key: str, entry: Dict[str, Any]) -> None:
+    import json
+    import os
+
+    cache = _identify_cache_load(repo_root)
+    cache.pop(key, None)
+    cache[key] = entry
+    # Trim oldest entries (dicts preserve insertion order)
+    while len(cache) > MAX_IDENTIFY_CACHE_ENTRIES:
+        cache.pop(next(iter(cache)))
+    path = repo_root / IDENTIFY_CACHE_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        log.debug("[community] Could not write identify cache at %s", path)
+
+
+async def astep_community_improvement(
+    client: Any,
+    state: Dict[str, Any],
+    creds: moltbook.Credentials,
+    cfg: moltbook.RunnerConfig,
+    safety_config: SafetyConfig,
+) -> Optional[str]:
+    """Async entry point for event-loop callers.
+
+    The LLM client underneath is synchronous, so the whole step runs in a
+    worker thread; the event loop stays free while the state machine blocks
+    on network or test runs.
+    """
+    return await asyncio.to_thread(
+        step_community_improvement, client, state, creds, cfg, safety_config
+    )
 
 
 def _step_identify(
@@ -96,28 +253,56 @@ def _step_identify(
     safety_config: SafetyConfig,
 ) -> Optional[str]:
     """Identify a real problem that would benefit from community input."""
+    cfg = _ResolvedCfg.from_runner(cfg)
     repo_root = get_repo_root()
+    model = cfg.model
 
-    log.info("[community] Analyzing codebase for community-suitable problems...")
-    codebase_summary = get_codebase_summary(repo_root)
-    test_results = run_tests(repo_root)
-    history = load_history(repo_root)
-    history_summary = summarize_history(history)
-
-    # Build test failure text
-    test_text = test_results.summary()
-    if test_results.failure_details:
-        test_text += "\n\nFailure details:\n"
-        for fail in test_results.failure_details:
-            test_text += f"- {fail.file}::{fail.test_name}: {fail.message}\n"
-            if fail.traceback:
-                test_text += f"  {fail.traceback[:200]}\n"
-
-    # Ask LLM to identify a problem suitable for community input
-    task_data = llm.analyze_codebase(
-        client, codebase_summary, test_text, history_summary,
-        model=getattr(cfg, "improvement_model", "gpt-4o"),
-    )
+    # Identical tree + model means identical analysis; skip the summary
+    # rebuild, test run, and LLM round-trip on no-change cycles.
+    cache_key = _tree_state_key(repo_root, model)
+    cached = _identify_cache_load(repo_root).get(cache_key) if cache_key else None
+
+    if cached is not None:
+        log.info("[community] Reusing identify analysis for unchanged tree")
+        task_data = cached.get("task_data")
+        test_text = cached.get("test_text", "")
+    else:
+        log.info("[community] Analyzing codebase for community-suitable problems...")
+        # Summary build, test run, and history load are independent blocking
+        # work; overlap them so this step costs max() instead of sum().
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            fut_summary = ex.submit(get_codebase_summary, repo_root)
+            fut_tests = ex.submit(run_tests, repo_root)
+            fut_history = ex.submit(load_history, repo_root)
+            codebase_summary = fut_summary.result()
+            test_results = fut_tests.result()
+            history = fut_history.result()
+        history_summary = summarize_history(history)
+
+        # Build test failure text; StringIO keeps this linear in output size
+        # instead of O(n^2) repeated str concatenation.
+        buf = io.StringIO()
+        buf.write(test_results.summary())
+        if test_results.failure_details:
+            buf.write("\n\nFailure details:\n")
+            for fail in test_results.failure_details:
+                buf.write(f"- {fail.file}::{fail.test_name}: {fail.message}\n")
+                if fail.traceback:
+                    buf.write(f"  {fail.traceback[:200]}\n")
+        test_text = buf.getvalue()
+
+        # Ask LLM to identify a problem suitable for community input
+        task_data = llm.analyze_codebase(
+            client, codebase_summary, test_text, history_summary,
+            model=model,
+        )
+        # Cache only real analysis results: a None from a transient API
+        # failure must not be replayed as "no problems" until the tree
+        # changes -- the next run should retry instead.
+        if cache_key and task_data is not None:
+            _identify_cache_store(
+                repo_root, cache_key, {"task_data": task_data, "test_text": test_text}
+            )
 
     if not task_data or task_data.get("task_type") == "none":
         log.info("[community] No problems identified for community input")
@@ -127,14 +312,13 @@ def _step_identify(
     task = ImprovementTask.from_llm_response(task_data)
 
     # Read code context for target files (truncated)
-    code_context = {}
-    for file_path in task.target_files:
-        full_path = repo_root / file_path
-        if full_path.exists():
-            content = read_file_raw(full_path)
-            if len(content) > MAX_CODE_CONTEXT_CHARS:
-                content = content[:MAX_CODE_CONTEXT_CHARS] + "\n# ... (truncated)"
-            code_context[file_path] = content
+    code_context = {
+        path: content
+        for path, content in _read_target_files(
+            repo_root, task.target_files, max_chars=MAX_CODE_CONTEXT_CHARS
+        ).items()
+        if content
+    }
 
     state["community_improvement"] = {
         "status": "identified",
@@ -166,12 +350,13 @@ def _step_post(
     cfg: moltbook.RunnerConfig,
 ) -> Optional[str]:
     """Generate and post a StackOverflow-style question to Moltbook."""
+    cfg = _ResolvedCfg.from_runner(cfg)
     ci = state["community_improvement"]
 
     # Check community post interval
     now = int(time.time())
     last_community_post = state.get("last_community_post")
-    interval_hours = getattr(cfg, "community_post_interval_hours", 1.0)
+    interval_hours = cfg.post_interval_s / 3600
     if last_community_post is not None:
         elapsed_hours = (now - int(last_community_post)) / 3600
         if elapsed_hours < interval_hours:
@@ -185,19 +370,12 @@ def _step_post(
             # Stay in identified state, will retry next cycle
             return "waiting_for_interval"
 
-    task_data = {
-        "task_type": ci["task_type"],
-        "description": ci["description"],
-        "target_files": ci["target_files"],
-        "evidence": ci["evidence"],
-    }
-
     post_data = llm.generate_question_post(
         client,
-        task_data,
+        _task_payload(ci),
         ci.get("code_context", {}),
         ci.get("test_output", ""),
-        model=getattr(cfg, "improvement_model", "gpt-4o"),
+        model=cfg.model,
     )
 
     if not post_data or "title" not in post_data or "content" not in post_data:
@@ -223,11 +401,11 @@ def _step_post(
             content=post_data["content"],
         )
         now = int(time.time())
-        wait_hours = getattr(cfg, "community_wait_hours", 48)
+        wait_hours = cfg.wait_s // 3600
 
         ci["post_id"] = result.get("id")
         ci["posted_at"] = now
-        ci["wait_until"] = now + wait_hours * 3600
+        ci["wait_until"] = now + cfg.wait_s
         ci["status"] = "waiting"
         state["last_community_post"] = now
 
@@ -251,24 +429,38 @@ def _step_wait(
     cfg: moltbook.RunnerConfig,
 ) -> Optional[str]:
     """Check if wait period is over or enough comments have arrived."""
+    cfg = _ResolvedCfg.from_runner(cfg)
     ci = state["community_improvement"]
     now = int(time.time())
     post_id = ci.get("post_id")
     wait_until = ci.get("wait_until", now)
-    min_comments = getattr(cfg, "community_min_comments_for_early", 3)
+    min_comments = cfg.min_comments
 
     if not post_id:
         ci["status"] = "failed"
         return "no_post_id"
 
-    # Fetch current comments
-    try:
-        comment_data = moltbook.get_post_comments(creds.api_key, post_id)
-        comments = comment_data.get("comments", [])
-        ci["comments_snapshot"] = comments
-    except Exception:
-        log.exception("[community] Failed to fetch comments")
+    # Fetch current comments -- TTL-gated, with a conditional GET on refetch
+    poll_interval = cfg.poll_interval_s
+    last_fetch = ci.get("comments_fetched_at") or 0
+    if now - last_fetch < poll_interval:
         comments = ci.get("comments_snapshot", [])
+    else:
+        try:
+            comment_data = moltbook.get_post_comments(
+                creds.api_key, post_id, etag=ci.get("comments_etag")
+            )
+            if comment_data is None:
+                # 304 Not Modified -- snapshot is still current
+                comments = ci.get("comments_snapshot", [])
+            else:
+                comments = comment_data.get("comments", [])
+                ci["comments_snapshot"] = comments
+                ci["comments_etag"] = comment_data.get("_etag")
+            ci["comments_fetched_at"] = now
+        except Exception:
+            log.exception("[community] Failed to fetch comments")
+            comments = ci.get("comments_snapshot", [])
 
     # Check early trigger: enough comments
     if len(comments) >= min_comments:
@@ -297,6 +489,7 @@ def _step_analyze(
     cfg: moltbook.RunnerConfig,
 ) -> Optional[str]:
     """Analyze comments for code suggestions, rank them, select best or fallback."""
+    cfg = _ResolvedCfg.from_runner(cfg)
     ci = state["community_improvement"]
     comments = ci.get("comments_snapshot", [])
 
@@ -311,7 +504,7 @@ def _step_analyze(
         ci["description"],
         ci.get("code_context", {}),
         comments,
-        model=getattr(cfg, "improvement_model", "gpt-4o"),
+        model=cfg.model,
     )
 
     if not analysis or not analysis.get("has_actionable"):
@@ -351,27 +544,14 @@ def _step_implement(
     safety_config: SafetyConfig,
 ) -> Optional[str]:
     """Generate code from the selected suggestion (or LLM-only fallback) and create PR."""
+    cfg = _ResolvedCfg.from_runner(cfg)
     ci = state["community_improvement"]
     repo_root = get_repo_root()
     is_fallback = ci.get("fallback_used", False)
-
-    # Build task object
-    task = ImprovementTask(
-        task_id=ci["task_id"],
-        task_type=ci["task_type"],
-        description=ci["description"],
-        target_files=ci["target_files"],
-        evidence=ci["evidence"],
-    )
+    task_data = _task_payload(ci)
 
     # Read current file contents
-    file_contents = {}
-    for file_path in task.target_files:
-        full_path = repo_root / file_path
-        if full_path.exists():
-            file_contents[file_path] = read_file_raw(full_path)
-        else:
-            file_contents[file_path] = ""
+    file_contents = _read_target_files(repo_root, ci["target_files"])
 
     # Build constraints
     constraints = (
@@ -379,20 +559,15 @@ def _step_implement(
         f"- Maximum {safety_config.max_lines_changed_per_pr} lines changed\n"
         f"- Only modify files under: {', '.join(safety_config.allowed_modification_paths)}\n"
         f"- NEVER modify: {', '.join(safety_config.forbidden_modification_paths)}\n"
-        f"- Task type: {task.task_type}"
+        f"- Task type: {ci['task_type']}"
     )
 
     # Generate plan
     plan = llm.plan_code_change(
         client,
-        {
-            "task_type": task.task_type,
-            "description": task.description,
-            "target_files": task.target_files,
-            "evidence": task.evidence,
-        },
+        task_data,
         "\n\n".join(f"### {p}\n{c}" for p, c in file_contents.items()),
-        model=getattr(cfg, "improvement_model", "gpt-4o"),
+        model=cfg.model,
     )
 
     if not plan:
@@ -404,13 +579,13 @@ def _step_implement(
     if is_fallback:
         raw_changes = llm.generate_code(
             client, plan, file_contents, constraints,
-            model=getattr(cfg, "improvement_model", "gpt-4o"),
+            model=cfg.model,
         )
     else:
         suggestion = ci.get("selected_comment", {})
         raw_changes = llm.generate_code_from_suggestion(
             client, suggestion, file_contents, plan, constraints,
-            model=getattr(cfg, "improvement_model", "gpt-4o"),
+            model=cfg.model,
         )
 
     if not raw_changes:
@@ -439,6 +614,7 @@ def _step_implement(
 
     # Validate (apply, test, revert if regression)
     log.info("[community] Validating changes...")
+    task = ImprovementTask(task_id=ci["task_id"], **task_data)
     improvement_result = validate_improvement(task, changes, repo_root)
 
     if improvement_result.status != "success":
@@ -446,7 +622,8 @@ def _step_implement(
         ci["status"] = "failed"
         return f"validation_{improvement_result.status}"
 
-    # Create PR with commenter credit
+    # Create PR with commenter credit: branch + commit happen here, the slow
+    # network half (push + PR creation) moves to the background worker.
     log.info("[community] Creating PR...")
     branch_name = git_ops.make_branch_name(f"community-{task.task_type}")
     original_branch = git_ops.current_branch(repo_root)
@@ -456,27 +633,107 @@ def _step_implement(
         changed_files = [c.file_path for c in changes]
         commit_msg = f"ouroboros: community {task.task_type} - {task.description}"
         git_ops.commit_changes(repo_root, commit_msg, changed_files)
-        git_ops.push_branch(repo_root, branch_name)
-
-        pr_body = _build_community_pr_body(task, changes, improvement_result, ci)
-        pr_url = git_ops.create_pr(
-            repo_root,
-            title=f"[ouroboros] community {task.task_type}: {task.description[:50]}",
-            body=pr_body,
-            base="main",
-        )
-        ci["pr_url"] = pr_url
-        ci["status"] = "completed"
-        log.info("[community] PR created: %s", pr_url)
-        return "pr_created"
-
     except Exception:
-        log.exception("[community] Failed to create PR")
+        log.exception("[community] Failed to commit changes")
         ci["status"] = "failed"
         return "pr_failed"
     finally:
         git_ops.checkout_branch(repo_root, original_branch)
 
+    _pr_futures[ci["task_id"]] = _PR_EXECUTOR.submit(
+        _push_and_create_pr, repo_root, branch_name, task, changes, improvement_result, ci
+    )
+    ci["status"] = "pushing"
+    return "pushing"
+
+
+def _push_and_create_pr(
+    repo_root,
+    branch_name: str,
+    task: ImprovementTask,
+    changes: List[CodeChange],
+    result: ImprovementResult,
+    ci: Dict[str, Any],
+) -> str:
+    """Push the branch and open the PR; runs on the PR worker thread."""
+    git_ops.push_branch(repo_root, branch_name)
+    pr_body = _build_community_pr_body(task, changes, result, ci)
+    # The worktree is back on the original branch by now, so the head
+    # must be named explicitly.
+    return git_ops.create_pr(
+        repo_root,
+        title=f"[ouroboros] community {task.task_type}: {task.description[:50]}",
+        body=pr_body,
+        base="main",
+        head=branch_name,
+    )
+
+
+def _step_pushing(state: Dict[str, Any]) -> Optional[str]:
+    """Poll the background push/PR future; transition when it settles."""
+    ci = state["community_improvement"]
+    future = _pr_futures.get(ci.get("task_id"))
+
+    if future is None:
+        log.warning("[community] No pending PR future for %s", ci.get("task_id"))
+        ci["status"] = "failed"
+        return "pr_failed"
+
+    if not future.done():
+        return "pushing"
+
+    _pr_futures.pop(ci["task_id"], None)
+    try:
+        pr_url = future.result()
+    except Exception:
+        log.exception("[community] Failed to create PR")
+        ci["status"] = "failed"
+        return "pr_failed"
+
+    ci["pr_url"] = pr_url
+    ci["status"] = "completed"
+    log.info("[community] PR created: %s", pr_url)
+    return "pr_created"
+
+
+# PR body templates; joined in one pass instead of ~20 list.append calls.
+_PR_HEADER_TMPL = """\
+## Community-Assisted Self-Improvement
+
+**Type**: {task_type}
+**Task ID**: {task_id}{post_line}
+
+### Description
+{description}
+
+### Evidence
+{evidence}
+
+"""
+
+_PR_CREDIT_TMPL = """\
+### Community Credit
+Solution inspired by **{author}**'s suggestion:
+> {content}
+
+"""
+
+_PR_FALLBACK_NOTE = """\
+### Note
+No actionable community suggestions were received. This improvement was generated by LLM-only fallback.
+
+"""
+
+_PR_FOOTER_TMPL = """\
+
+### Test Results
+- **Before**: {before}
+- **After**: {after}
+
+---
+Generated by Ouroboros community-assisted self-improvement engine.
+Human review and approval required before merge."""
+
 
 def _build_community_pr_body(
     task: ImprovementTask,
@@ -489,60 +746,40 @@ def _build_community_pr_body(
     selected = ci.get("selected_comment", {})
     post_id = ci.get("post_id")
 
-    lines = [
-        "## Community-Assisted Self-Improvement",
-        "",
-        f"**Type**: {task.task_type}",
-        f"**Task ID**: {task.task_id}",
-    ]
-
+    post_line = ""
     if post_id:
         post_url = moltbook._post_url(post_id)
         if post_url:
-            lines.append(f"**Moltbook Post**: {post_url}")
-
-    lines.extend([
-        "",
-        "### Description",
-        task.description,
-        "",
-        "### Evidence",
-        task.evidence,
-        "",
-    ])
+            post_line = f"\n**Moltbook Post**: {post_url}"
+
+    header = _PR_HEADER_TMPL.format(
+        task_type=task.task_type,
+        task_id=task.task_id,
+        post_line=post_line,
+        description=task.description,
+        evidence=task.evidence,
+    )
 
     if not is_fallback and selected:
-        author = selected.get("author", "unknown")
-        lines.extend([
-            "### Community Credit",
-            f"Solution inspired by **{author}**'s suggestion:",
-            f"> {selected.get('content', '')}",
-            "",
-        ])
+        credit = _PR_CREDIT_TMPL.format(
+            author=selected.get("author", "unknown"),
+            content=selected.get("content", ""),
+        )
     elif is_fallback:
-        lines.extend([
-            "### Note",
-            "No actionable community suggestions were received. "
-            "This improvement was generated by LLM-only fallback.",
-            "",
-        ])
-
-    lines.append("### Changes")
-    for change in changes:
-        lines.append(f"- `{change.file_path}`: {change.description}")
-
-    lines.extend([
-        "",
-        "### Test Results",
-        f"- **Before**: {result.test_before.summary() if result.test_before else 'N/A'}",
-        f"- **After**: {result.test_after.summary() if result.test_after else 'N/A'}",
-        "",
-        "---",
-        "Generated by Ouroboros community-assisted self-improvement engine.",
-        "Human review and approval required before merge.",
-    ])
-
-    return "\n".join(lines)
+        credit = _PR_FALLBACK_NOTE
+    else:
+        credit = ""
+
+    changes_section = "### Changes\n" + "\n".join(
+        f"- `{c.file_path}`: {c.description}" for c in changes
+    )
+
+    footer = _PR_FOOTER_TMPL.format(
+        before=result.test_before.summary() if result.test_before else "N/A",
+        after=result.test_after.summary() if result.test_after else "N/A",
+    )
+
+    return "".join((header, credit, changes_section, footer))
 
 
 def clear_community_improvement(state: Dict[str, Any]) -> None:
@@ -1,8 +1,9 @@
-from dataclasses import dataclass
-from typing import Tuple
+import functools
+from dataclasses import dataclass, field
+from typing import Literal, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SafetyConfig:
     pr_only: bool = True
     allow_network: bool = True
@@ -27,3 +28,56 @@ class SafetyConfig:
         "evaluation.py",
         "policies.py",
     )
+
+    # Derived lookup structures for hot path checks:
+    # str.startswith accepts a tuple in one C call, and frozenset
+    # membership is O(1) versus a scan over the tuple.
+    allowed_prefixes: Tuple[str, ...] = field(init=False, default=())
+    forbidden_basenames: frozenset = field(init=False, default=frozenset())
+    # Segment trie over allowed_modification_paths: checking a path is
+    # O(path depth) no matter how many prefixes are configured.
+    _allowed_trie: dict = field(init=False, default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "allowed_prefixes", tuple(self.allowed_modification_paths))
+        object.__setattr__(
+            self, "forbidden_basenames", frozenset(self.forbidden_modification_paths)
+        )
+        trie: dict = {}
+        for prefix in self.allowed_modification_paths:
+            node = trie
+            for segment in prefix.strip("/").split("/"):
+                node = node.setdefault(segment, {})
+            node[""] = True  # terminal marker: everything below is allowed
+        object.__setattr__(self, "_allowed_trie", trie)
+
+    def is_allowed(self, path: str) -> bool:
+        """Return True if `path` falls under an allowed modification prefix."""
+        node = self._allowed_trie
+        for segment in path.split("/"):
+            if "" in node:
+                return True
+            next_node = node.get(segment)
+            if next_node is None:
+                return False
+            node = next_node
+        return "" in node
+
+
+@functools.cache
+def safety_preset(name: Literal["default", "strict", "permissive"] = "default") -> SafetyConfig:
+    """Return a shared SafetyConfig preset; repeat calls are a dict lookup.
+
+    The instances are frozen, so sharing them across callers is safe.
+    """
+    if name == "strict":
+        return SafetyConfig(
+            allow_self_modification=False,
+            max_improvements_per_day=1,
+        )
+    if name == "permissive":
+        return SafetyConfig(
+            require_human_approval=False,
+            max_improvements_per_day=5,
+        )
+    return SafetyConfig()
@@ -1,27 +1,53 @@
 """Git and PR operations for the self-improvement workflow."""
 
+import functools
+import json
 import logging
 import os
+import re
 import subprocess
 import time
+from collections import ChainMap
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Mapping, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
 
 log = logging.getLogger(__name__)
 
+_GIT_ENV_DEFAULTS = {
+    "GIT_AUTHOR_NAME": "ouroboros-bot",
+    "GIT_AUTHOR_EMAIL": "ouroboros-bot@localhost",
+    "GIT_COMMITTER_NAME": "ouroboros-bot",
+    "GIT_COMMITTER_EMAIL": "ouroboros-bot@localhost",
+}
+
+
+def _safe_git_env() -> Mapping[str, str]:
+    """Return env mapping with git author/committer set for the bot.
 
-def _safe_git_env() -> Dict[str, str]:
-    """Return env dict with git author/committer set for the bot."""
-    env = os.environ.copy()
-    env.setdefault("GIT_AUTHOR_NAME", "ouroboros-bot")
-    env.setdefault("GIT_AUTHOR_EMAIL", "ouroboros-bot@localhost")
-    env.setdefault("GIT_COMMITTER_NAME", "ouroboros-bot")
-    env.setdefault("GIT_COMMITTER_EMAIL", "ouroboros-bot@localhost")
-    return env
+    A ChainMap view over os.environ: values set in the environment win,
+    the bot identity fills the gaps. No per-call copy of the environment.
+    """
+    return ChainMap(os.environ, _GIT_ENV_DEFAULTS)
 
 
-def _git(repo: Path, *args: str, check: bool = True, timeout: int = 30) -> subprocess.CompletedProcess:
-    """Run a git command in the given repo."""
+def _git(
+    repo: Path,
+    *args: str,
+    check: bool = True,
+    timeout: int = 30,
+    input: Optional[str] = None,
+) -> subprocess.CompletedProcess:
+    """Run a git command in the given repo.
+
+    close_fds=False lets CPython take its posix_spawn/vfork fast path,
+    which skips the COW page setup of a full fork -- noticeable when the
+    parent process has a large heap. git opens no inherited fds itself.
+    """
     return subprocess.run(
         ["git", *args],
         cwd=repo,
@@ -30,13 +56,38 @@ def _git(repo: Path, *args: str, check: bool = True, timeout: int = 30) -> subpr
         env=_safe_git_env(),
         check=check,
         timeout=timeout,
+        input=input,
+        close_fds=False,
     )
 
 
-def is_clean(repo: Path) -> bool:
-    """Return True if the working tree has no uncommitted changes."""
-    result = _git(repo, "status", "--porcelain", check=False)
-    return result.stdout.strip() == ""
+def is_clean(repo: Path, include_untracked: bool = False) -> bool:
+    """Return True if the working tree has no uncommitted changes.
+
+    The untracked-file walk is skipped by default (-uno); on large
+    worktrees that walk dominates `git status`. Reading stops at the
+    first porcelain line -- one entry is enough to call the tree dirty.
+    Pass include_untracked=True when stray files matter.
+    """
+    cmd = [
+        "git", "--no-optional-locks", "status", "--porcelain=v1",
+        "--ignore-submodules=all",
+        "-unormal" if include_untracked else "-uno",
+    ]
+    proc = subprocess.Popen(
+        cmd,
+        cwd=repo,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env=_safe_git_env(),
+    )
+    try:
+        first_line = proc.stdout.readline()
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+    return first_line.strip() == ""
 
 
 def current_branch(repo: Path) -> str:
@@ -68,14 +119,24 @@ def delete_branch(repo: Path, name: str) -> None:
     _git(repo, "branch", "-D", name, check=False)
 
 
+# Matches the "[branch abc1234] subject" summary line git commit prints.
+_COMMIT_SUMMARY_RE = re.compile(r"\[[^\]]+\b([0-9a-f]{7,40})\]")
+
+
 def commit_changes(repo: Path, message: str, files: List[str]) -> str:
     """Stage specified files and commit. Returns the commit hash."""
     if not files:
         raise ValueError("No files to commit")
-    _git(repo, "add", *files)
-    _git(repo, "commit", "-m", message)
-    result = _git(repo, "rev-parse", "HEAD")
-    return result.stdout.strip()
+    # Pathspecs go via stdin: one add process regardless of list size,
+    # and no ARG_MAX ceiling on large change sets.
+    _git(repo, "add", "--pathspec-from-file=-", input="\n".join(files))
+    result = _git(repo, "commit", "-m", message)
+    # The commit summary line already carries the hash; parsing it saves
+    # the third fork for rev-parse HEAD (with a fallback just in case).
+    match = _COMMIT_SUMMARY_RE.search(result.stdout)
+    if match:
+        return match.group(1)
+    return _git(repo, "rev-parse", "HEAD").stdout.strip()
 
 
 def push_branch(repo: Path, branch: str) -> None:
@@ -109,11 +170,122 @@ def create_pr(
         timeout=60,
     )
     # gh pr create prints the URL on stdout
+    invalidate_open_pr_cache()
+    _record_open_pr(head or current_branch(repo))
     return result.stdout.strip()
 
 
+# The orchestrator polls for open improvement PRs every loop cycle; answers
+# rarely change, so one gh round-trip per minute is plenty.
+_OPEN_PR_TTL_SECONDS = 60
+_open_pr_cache: Optional[Tuple[float, bool]] = None
+
+# Local marker recording PRs we created ourselves: while it is fresh, a
+# single stat answers "is there an open improvement PR?" with no process
+# exec and no network round-trip, across restarts too.
+_OPEN_PR_MARKER = os.path.expanduser("~/.config/moltbook/open_prs.json")
+_OPEN_PR_MARKER_TTL_SECONDS = 300
+
+
+def _record_open_pr(branch: str) -> None:
+    """Add a just-created PR branch to the local marker file."""
+    try:
+        data = {}
+        if os.path.exists(_OPEN_PR_MARKER):
+            with open(_OPEN_PR_MARKER, "r", encoding="utf-8") as f:
+                data = json.load(f) or {}
+    except (OSError, ValueError):
+        data = {}
+    data[branch] = time.time()
+    try:
+        os.makedirs(os.path.dirname(_OPEN_PR_MARKER), exist_ok=True)
+        with open(_OPEN_PR_MARKER, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError:
+        log.debug("Could not write open-PR marker at %s", _OPEN_PR_MARKER)
+
+
+def _marker_is_fresh() -> bool:
+    """One stat: was a PR recorded within the marker TTL?"""
+    try:
+        return time.time() - os.stat(_OPEN_PR_MARKER).st_mtime < _OPEN_PR_MARKER_TTL_SECONDS
+    except OSError:
+        return False
+
+
+_REMOTE_SLUG_RE = re.compile(r"github\.com[:/]([^/\s]+/[^/\s]+?)(?:\.git)?$")
+_gh_rest: Optional["httpx.Client"] = None
+
+
+@functools.lru_cache(maxsize=4)
+def _github_repo_slug(repo: Path) -> Optional[str]:
+    """owner/name parsed from the origin remote, or None."""
+    result = _git(repo, "remote", "get-url", "origin", check=False)
+    match = _REMOTE_SLUG_RE.search(result.stdout.strip())
+    return match.group(1) if match else None
+
+
+def _gh_rest_client() -> Optional["httpx.Client"]:
+    """Shared GitHub REST client, one persistent TLS session per process.
+
+    Requires httpx and a token in the environment; callers fall back to
+    the gh CLI (which manages its own auth) when either is missing.
+    """
+    global _gh_rest
+    if httpx is None:
+        return None
+    if _gh_rest is None:
+        token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+        if not token:
+            return None
+        _gh_rest = httpx.Client(
+            base_url="https://api.github.com",
+            headers={
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github+json",
+            },
+            timeout=10,
+        )
+    return _gh_rest
+
+
+def invalidate_open_pr_cache() -> None:
+    """Drop the cached open-PR answer; called whenever we create a PR."""
+    global _open_pr_cache
+    _open_pr_cache = None
+
+
 def has_open_improvement_prs(repo: Path) -> bool:
-    """Check if there are any open PRs with the ouroboros/improve- prefix."""
+    """Check if there are any open PRs with the ouroboros/improve- prefix.
+
+    The answer is cached for a short TTL; errors are not cached. A PR we
+    created ourselves within the last few minutes is answered from the
+    local marker file without shelling out at all.
+    """
+    global _open_pr_cache
+    now = time.monotonic()
+    if _open_pr_cache is not None and now - _open_pr_cache[0] < _OPEN_PR_TTL_SECONDS:
+        return _open_pr_cache[1]
+    if _marker_is_fresh():
+        return True
+
+    # Prefer the pooled REST session: no Go binary exec, no per-call TLS
+    # handshake. The gh CLI below remains the fallback.
+    client = _gh_rest_client()
+    slug = _github_repo_slug(repo)
+    if client is not None and slug:
+        try:
+            resp = client.get(f"/repos/{slug}/pulls", params={"state": "open", "per_page": 100})
+            resp.raise_for_status()
+            has_open = any(
+                (pr.get("head") or {}).get("ref", "").startswith("ouroboros/improve-")
+                for pr in resp.json()
+            )
+            _open_pr_cache = (now, has_open)
+            return has_open
+        except Exception:
+            log.debug("GitHub REST probe failed, falling back to gh CLI")
+
     try:
         result = subprocess.run(
             ["gh", "pr", "list", "--state", "open", "--json", "headRefName", "-q",
@@ -125,7 +297,9 @@ def has_open_improvement_prs(repo: Path) -> bool:
             timeout=30,
         )
         branches = result.stdout.strip().splitlines()
-        return any(b.startswith("ouroboros/improve-") for b in branches)
+        has_open = any(b.startswith("ouroboros/improve-") for b in branches)
+        _open_pr_cache = (now, has_open)
+        return has_open
     except (subprocess.CalledProcessError, FileNotFoundError):
         log.warning("Could not check open PRs (gh CLI unavailable?)")
         return False
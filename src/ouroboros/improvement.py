@@ -1,15 +1,19 @@
 """Core self-improvement engine -- identify, plan, generate, validate, PR."""
 
+import difflib
+import functools
 import logging
+import os
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from . import git_ops, llm
 from .codebase import get_codebase_summary, get_repo_root, read_file_raw
-from .config import SafetyConfig
+from .config import SafetyConfig, safety_preset
 from .evaluation import (
     EvaluationRecord,
     improvements_today,
@@ -22,7 +26,7 @@ from .test_runner import TestResult, run_tests
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImprovementTask:
     task_id: str
     task_type: str  # fix_test | add_test | fix_bug
@@ -41,7 +45,7 @@ class ImprovementTask:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeChange:
     file_path: str
     original_content: str
@@ -49,7 +53,7 @@ class CodeChange:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ImprovementResult:
     task: ImprovementTask
     changes: List[CodeChange] = field(default_factory=list)
@@ -69,21 +73,27 @@ IMMUTABLE_FILES = frozenset({
 })
 
 
+@functools.lru_cache(maxsize=8)
+def _blocked_basenames(config: SafetyConfig) -> frozenset:
+    """Hardcoded immutables and config-forbidden names, merged once."""
+    return IMMUTABLE_FILES | config.forbidden_basenames
+
+
+@functools.lru_cache(maxsize=1024)
 def _is_path_allowed(file_path: str, config: SafetyConfig) -> bool:
-    """Check if a file path is allowed for modification."""
-    # Check forbidden paths (match by filename)
-    basename = Path(file_path).name
-    if basename in IMMUTABLE_FILES:
-        return False
-    if basename in config.forbidden_modification_paths:
-        return False
+    """Check if a file path is allowed for modification.
 
-    # Check allowed paths (match by prefix)
-    for allowed in config.allowed_modification_paths:
-        if file_path.startswith(allowed):
-            return True
+    Memoized: the same paths are checked in _validate_changes and again
+    in apply_changes, and SafetyConfig is frozen so (path, config) keys
+    are stable.
+    """
+    # Check forbidden paths (match by filename, one merged set lookup);
+    # rpartition avoids a PurePath allocation just to take a basename.
+    if file_path.rpartition("/")[2] in _blocked_basenames(config):
+        return False
 
-    return False
+    # Check allowed paths (trie walk, O(path depth))
+    return config.is_allowed(file_path)
 
 
 def _validate_changes(changes: List[CodeChange], config: SafetyConfig) -> List[str]:
@@ -103,9 +113,7 @@ def _validate_changes(changes: List[CodeChange], config: SafetyConfig) -> List[s
         if not _is_path_allowed(change.file_path, config):
             violations.append(f"Forbidden file modification: {change.file_path}")
 
-        orig_lines = change.original_content.count("\n")
-        new_lines = change.new_content.count("\n")
-        total_lines += abs(new_lines - orig_lines) + _count_changed_lines(
+        total_lines += _count_changed_lines(
             change.original_content, change.new_content
         )
 
@@ -118,17 +126,20 @@ def _validate_changes(changes: List[CodeChange], config: SafetyConfig) -> List[s
 
 
 def _count_changed_lines(original: str, new: str) -> int:
-    """Count the number of lines that differ between two strings."""
-    orig_lines = original.splitlines()
-    new_lines = new.splitlines()
-    # Simple diff count: lines added + lines removed
-    max_len = max(len(orig_lines), len(new_lines))
+    """Count the number of lines that differ between two strings.
+
+    Diff-based: an inserted line near the top counts once instead of
+    cascading a positional mismatch through every line that follows.
+    """
+    if original == new:
+        return 0
+    matcher = difflib.SequenceMatcher(
+        None, original.splitlines(), new.splitlines(), autojunk=False
+    )
     changed = 0
-    for i in range(max_len):
-        orig = orig_lines[i] if i < len(orig_lines) else None
-        new = new_lines[i] if i < len(new_lines) else None
-        if orig != new:
-            changed += 1
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            changed += max(i2 - i1, j2 - j1)
     return changed
 
 
@@ -141,13 +152,26 @@ def identify_improvements(
     additional_context: str = "",
 ) -> Optional[ImprovementTask]:
     """Ask the LLM to identify one improvement to make."""
-    test_summary = test_results.summary()
+    parts = [test_results.summary()]
     if test_results.failure_details:
-        test_summary += "\n\nFailure details:\n"
+        parts.append("\n\nFailure details:\n")
+        # Dedup identical failure messages: parametrized tests failing the
+        # same way collapse to one line with a count, keeping the prompt
+        # (and its token cost) proportional to distinct failures.
+        seen: Dict[str, int] = {}
         for fail in test_results.failure_details:
-            test_summary += f"- {fail.file}::{fail.test_name}: {fail.message}\n"
+            key = fail.message
+            if key in seen:
+                seen[key] += 1
+                continue
+            seen[key] = 1
+            parts.append(f"- {fail.file}::{fail.test_name}: {fail.message}\n")
             if fail.traceback:
-                test_summary += f"  {fail.traceback[:200]}\n"
+                parts.append(f"  {fail.traceback[:200]}\n")
+        repeats = sum(n - 1 for n in seen.values())
+        if repeats:
+            parts.append(f"  (+{repeats} further failures with identical messages)\n")
+    test_summary = "".join(parts)
 
     history_summary = summarize_history(history)
     result = llm.analyze_codebase(
@@ -217,16 +241,36 @@ def generate_changes(
     return changes
 
 
-def apply_changes(changes: List[CodeChange], repo_root: Path) -> None:
-    """Write changes to disk. Raises on forbidden paths."""
-    config = SafetyConfig()
+# Parent directories already created (or observed) by apply_changes;
+# skips a mkdir syscall per change once a parent is known to exist.
+_MKDIR_CACHE: set = set()
+
+
+def apply_changes(
+    changes: List[CodeChange],
+    repo_root: Path,
+    config: Optional[SafetyConfig] = None,
+) -> None:
+    """Write changes to disk. Raises on forbidden paths.
+
+    Each file lands via a temp sibling + os.replace, so a crash mid-loop
+    leaves every individual file either old or new, never truncated.
+    Callers that already hold a SafetyConfig should pass it in; the
+    default builds the shared preset instead of a fresh instance.
+    """
+    config = config or safety_preset()
     for change in changes:
         if not _is_path_allowed(change.file_path, config):
             raise PermissionError(f"Cannot modify forbidden file: {change.file_path}")
 
         full_path = repo_root / change.file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(change.new_content, encoding="utf-8")
+        parent = full_path.parent
+        if parent not in _MKDIR_CACHE:
+            parent.mkdir(parents=True, exist_ok=True)
+            _MKDIR_CACHE.add(parent)
+        tmp_path = full_path.with_name(full_path.name + ".tmp")
+        tmp_path.write_bytes(change.new_content.encode("utf-8"))
+        os.replace(tmp_path, full_path)
 
 
 def revert_changes(changes: List[CodeChange], repo_root: Path) -> None:
@@ -244,15 +288,18 @@ def validate_improvement(
     task: ImprovementTask,
     changes: List[CodeChange],
     repo_root: Path,
+    test_before: Optional[TestResult] = None,
 ) -> ImprovementResult:
     """Apply changes, run tests, revert if tests regress.
 
     Returns an ImprovementResult with test_before, test_after, and status.
+    Callers that already ran the suite against the unmodified tree can
+    pass that result as `test_before`, skipping a full duplicate run.
     """
     result = ImprovementResult(task=task, changes=changes)
 
-    # Run tests before changes
-    result.test_before = run_tests(repo_root)
+    # Run tests before changes (unless the caller already has a result)
+    result.test_before = test_before or run_tests(repo_root)
     log.info("Tests before: %s", result.test_before.summary())
 
     # Validate safety constraints
@@ -271,7 +318,22 @@ def validate_improvement(
         result.status = "failed"
         return result
 
-    # Run tests after changes
+    # Run tests after changes. For fix_test tasks, re-run just the known
+    # failures first: if they still fail, revert without paying for a
+    # full suite run. The full run still happens on success so
+    # regressions elsewhere are caught before the PR.
+    if task.task_type == "fix_test" and result.test_before.failure_details:
+        targets = [
+            f"{f.file}::{f.test_name}" for f in result.test_before.failure_details
+        ]
+        targeted = run_tests(repo_root, extra_args=targets)
+        if targeted.failed > 0 or targeted.errors > 0:
+            log.warning("Targeted tests still failing after changes, reverting")
+            result.test_after = targeted
+            revert_changes(changes, repo_root)
+            result.status = "reverted"
+            return result
+
     result.test_after = run_tests(repo_root)
     log.info("Tests after: %s", result.test_after.summary())
 
@@ -367,11 +429,17 @@ def run_improvement_cycle(
         log.info("Skipping improvement: open improvement PRs exist")
         return None
 
-    # Step 1: Understand the codebase
+    # Step 1: Understand the codebase. The summary build, test run, and
+    # history load are independent blocking work; overlapping them on a
+    # small pool makes this step cost max() instead of sum().
     log.info("[improve] Analyzing codebase...")
-    codebase_summary = get_codebase_summary(repo_root)
-    test_results = run_tests(repo_root)
-    history = load_history(repo_root)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        fut_summary = ex.submit(get_codebase_summary, repo_root)
+        fut_tests = ex.submit(run_tests, repo_root)
+        fut_history = ex.submit(load_history, repo_root)
+        codebase_summary = fut_summary.result()
+        test_results = fut_tests.result()
+        history = fut_history.result()
 
     # Assemble additional context from feed intelligence
     additional_context = _assemble_feed_context(client, state)
@@ -393,13 +461,13 @@ def run_improvement_cycle(
         log.info("[improve] Dry run -- would proceed with: %s", task.description)
         return result
 
-    # Step 3: Read target files
+    # Step 3: Read target files once; generate_changes and the resulting
+    # CodeChange.original_content alias these strings rather than copying.
     relevant_code = {}
     for file_path in task.target_files:
-        full_path = repo_root / file_path
-        if full_path.exists():
-            relevant_code[file_path] = read_file_raw(full_path)
-        else:
+        try:
+            relevant_code[file_path] = read_file_raw(repo_root / file_path)
+        except FileNotFoundError:
             relevant_code[file_path] = ""
 
     # Step 4: Plan the improvement
@@ -416,9 +484,13 @@ def run_improvement_cycle(
         log.warning("[improve] Failed to generate code changes")
         return None
 
-    # Step 6: Validate (apply, test, revert if needed)
+    # Step 6: Validate (apply, test, revert if needed). The step-1 test
+    # run already covers the unmodified tree, so reuse it as the baseline
+    # instead of paying for a second full suite run.
     log.info("[improve] Validating changes...")
-    improvement_result = validate_improvement(task, changes, repo_root)
+    improvement_result = validate_improvement(
+        task, changes, repo_root, test_before=test_results
+    )
 
     if improvement_result.status != "success":
         log.warning("[improve] Improvement failed: %s", improvement_result.status)
@@ -458,39 +530,43 @@ def run_improvement_cycle(
     return improvement_result
 
 
+# PR body template; filled in one pass instead of per-line list appends.
+_PR_BODY_TMPL = """\
+## Autonomous Self-Improvement
+
+**Type**: {task_type}
+**Task ID**: {task_id}
+
+### Description
+{description}
+
+### Evidence
+{evidence}
+
+### Changes
+{changes}
+
+### Test Results
+- **Before**: {before}
+- **After**: {after}
+
+---
+Generated autonomously by Ouroboros self-improvement engine.
+Human review and approval required before merge."""
+
+
 def _build_pr_body(
     task: ImprovementTask,
     changes: List[CodeChange],
     result: ImprovementResult,
 ) -> str:
     """Build the PR description."""
-    lines = [
-        "## Autonomous Self-Improvement",
-        "",
-        f"**Type**: {task.task_type}",
-        f"**Task ID**: {task.task_id}",
-        "",
-        f"### Description",
-        task.description,
-        "",
-        f"### Evidence",
-        task.evidence,
-        "",
-        "### Changes",
-    ]
-
-    for change in changes:
-        lines.append(f"- `{change.file_path}`: {change.description}")
-
-    lines.extend([
-        "",
-        "### Test Results",
-        f"- **Before**: {result.test_before.summary() if result.test_before else 'N/A'}",
-        f"- **After**: {result.test_after.summary() if result.test_after else 'N/A'}",
-        "",
-        "---",
-        "Generated autonomously by Ouroboros self-improvement engine.",
-        "Human review and approval required before merge.",
-    ])
-
-    return "\n".join(lines)
+    return _PR_BODY_TMPL.format(
+        task_type=task.task_type,
+        task_id=task.task_id,
+        description=task.description,
+        evidence=task.evidence,
+        changes="\n".join(f"- `{c.file_path}`: {c.description}" for c in changes),
+        before=result.test_before.summary() if result.test_before else "N/A",
+        after=result.test_after.summary() if result.test_after else "N/A",
+    )
@@ -1,12 +1,16 @@
 """Knowledge base -- persisted insights from community posts."""
 
-import fcntl
 import json
 import logging
 import os
 import time
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 KB_PATH = os.path.expanduser("~/.config/moltbook/knowledge_base.json")
@@ -14,45 +18,115 @@ MAX_ENTRIES = 200
 _SUMMARY_MAX_AGE = 86400  # 24 hours
 _SUMMARY_NEW_ENTRY_THRESHOLD = 20
 
+# Appended entries land in a JSONL sidecar next to the KB file; it is
+# folded back into the main file on compaction or any full save.
+_SIDECAR_SUFFIX = ".entries.jsonl"
+_SIDECAR_TAIL_BYTES = 64 * 1024
+_SIDECAR_COMPACT_BYTES = 2 * MAX_ENTRIES * 1024
+
+
+def _sidecar_path(p: str) -> str:
+    return os.path.splitext(p)[0] + _SIDECAR_SUFFIX
+
+
+def _dumps_line(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _load_sidecar(p: str) -> List[Dict[str, Any]]:
+    """Read appended entries from the sidecar, tail-limited.
+
+    Only the last _SIDECAR_TAIL_BYTES are read; with MAX_ENTRIES capping
+    what load_kb keeps anyway, older lines can never matter.
+    """
+    try:
+        with open(_sidecar_path(p), "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - _SIDECAR_TAIL_BYTES)
+            f.seek(start)
+            data = f.read()
+    except OSError:
+        return []
+    if start:
+        # Seeking mid-file can land inside a line; drop the partial one.
+        newline = data.find(b"\n")
+        data = data[newline + 1:] if newline >= 0 else b""
+    entries = []
+    for line in data.splitlines():
+        if line:
+            try:
+                entries.append(orjson.loads(line) if orjson is not None else json.loads(line))
+            except ValueError:
+                continue
+    return entries
+
 
 def load_kb(path: Optional[str] = None) -> Dict[str, Any]:
-    """Load the knowledge base from disk."""
+    """Load the knowledge base from disk, merging any sidecar appends."""
     p = path or KB_PATH
-    if not os.path.exists(p):
-        return {"entries": [], "summary_cache": "", "summary_updated_at": 0}
-    try:
-        with open(p, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        log.warning("Corrupt knowledge base at %s, starting fresh", p)
-        return {"entries": [], "summary_cache": "", "summary_updated_at": 0}
+    kb = {"entries": [], "summary_cache": "", "summary_updated_at": 0}
+    if os.path.exists(p):
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                kb = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            log.warning("Corrupt knowledge base at %s, starting fresh", p)
+    sidecar = _load_sidecar(p)
+    if sidecar:
+        kb.setdefault("entries", []).extend(sidecar)
+    if len(kb.get("entries", [])) > MAX_ENTRIES:
+        kb["entries"] = kb["entries"][-MAX_ENTRIES:]
+    return kb
 
 
 def save_kb(kb: Dict[str, Any], path: Optional[str] = None) -> None:
-    """Atomic write of the knowledge base."""
+    """Atomic write of the knowledge base.
+
+    Atomicity comes from os.replace alone -- the temp file is private to
+    this writer, so the old flock on it bought nothing. Encoding happens
+    in one shot (orjson when available, ~5x faster) and lands via a raw
+    fd write + fdatasync; the rename then publishes the file.
+    """
     p = path or KB_PATH
     os.makedirs(os.path.dirname(p), exist_ok=True)
     tmp_path = p + ".tmp"
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        fcntl.flock(f, fcntl.LOCK_EX)
-        try:
-            json.dump(kb, f, indent=2, sort_keys=True)
-            f.flush()
-            os.fsync(f.fileno())
-        finally:
-            fcntl.flock(f, fcntl.LOCK_UN)
+    if orjson is not None:
+        data = orjson.dumps(kb, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(kb, indent=2, sort_keys=True).encode("utf-8")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fdatasync(fd)
+    finally:
+        os.close(fd)
     os.replace(tmp_path, p)
+    # The sidecar's entries are now folded into the main file
+    try:
+        os.unlink(_sidecar_path(p))
+    except FileNotFoundError:
+        pass
 
 
 def add_entries(entries: List[Dict[str, Any]], path: Optional[str] = None) -> None:
-    """Append entries to the knowledge base and trim to MAX_ENTRIES."""
+    """Append entries to the knowledge base.
+
+    O(new entries) per call: lines go to the JSONL sidecar instead of
+    re-serializing the whole KB. Once the sidecar outgrows the compaction
+    threshold it is folded back into the main file.
+    """
     if not entries:
         return
-    kb = load_kb(path)
-    kb["entries"].extend(entries)
-    if len(kb["entries"]) > MAX_ENTRIES:
-        kb["entries"] = kb["entries"][-MAX_ENTRIES:]
-    save_kb(kb, path)
+    p = path or KB_PATH
+    os.makedirs(os.path.dirname(p), exist_ok=True)
+    sidecar = _sidecar_path(p)
+    with open(sidecar, "ab") as f:
+        for entry in entries:
+            f.write(_dumps_line(entry))
+    if os.path.getsize(sidecar) > _SIDECAR_COMPACT_BYTES:
+        save_kb(load_kb(p), p)
 
 
 def get_summary(
@@ -76,8 +150,17 @@ def get_summary(
     updated_at = kb.get("summary_updated_at", 0)
     now = int(time.time())
 
-    # Count entries added since last summary
-    entries_since = sum(1 for e in entries if e.get("ts", 0) > updated_at)
+    # Count entries added since last summary. Entries append in time
+    # order, so scan from the newest and stop at the first old one --
+    # and stop early once the refresh threshold is reached, since only
+    # "enough new entries?" matters, not the exact count.
+    entries_since = 0
+    for e in reversed(entries):
+        if e.get("ts", 0) <= updated_at:
+            break
+        entries_since += 1
+        if entries_since >= _SUMMARY_NEW_ENTRY_THRESHOLD:
+            break
 
     needs_refresh = (
         force_refresh
@@ -1,23 +1,85 @@
 """Thin OpenAI wrapper -- pure functions, no class abstractions."""
 
+from __future__ import annotations
+
+import asyncio
+import collections
+import functools
+import hashlib
+import io
 import json
 import logging
 import os
-from typing import Optional
-
-from openai import OpenAI
-
-from . import prompts
+import random
+import re
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:  # the openai import is deferred; see _retriable_errors
+    from openai import AsyncOpenAI, OpenAI
+
+from . import llm_cache, prompts, semantic_cache
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 log = logging.getLogger(__name__)
 
 
+def _loads(data):
+    """json.loads, via orjson when available (~3-5x faster).
+
+    The 2000-token code-change responses decode on the post-LLM hot
+    path; once the caches absorb most round-trips, parse time is a
+    visible share of what remains.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> str:
+    """Serialize compactly, via orjson when available (~5-10x faster)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Prompt text is immutable for the life of the process; bind each one
+# once at import so the call paths (including cache-hit paths where the
+# prompt build is the only remaining work) don't rebuild them per call.
+_COMMENT_SYS_PROMPT = prompts.load_comment_system_prompt()
+_POST_GEN_PROMPT = prompts.load_post_generation_prompt()
+_QUESTION_POST_PROMPT = prompts.load_question_post_prompt()
+_CODE_SUG_PROMPT = prompts.load_code_suggestion_prompt()
+_SUG_IMPL_PROMPT = prompts.load_suggestion_implementation_prompt()
+_COMMENT_ANALYSIS_PROMPT = prompts.load_comment_analysis_prompt()
+_COMMENT_MINING_PROMPT = prompts.load_comment_mining_prompt()
+_TOPIC_SIGNAL_PROMPT = prompts.load_topic_signal_prompt()
+_INSIGHT_PROMPT = prompts.load_insight_extraction_prompt()
+_KB_SUMMARY_PROMPT = prompts.load_kb_summary_prompt()
+
+
+@functools.lru_cache(maxsize=1)
 def load_openai_key() -> str:
     """Return OpenAI API key from env var or config file.
 
     Checks ``OPENAI_API_KEY`` first, then
     ``~/.config/moltbook/openai.json`` (key: ``api_key``).
     Raises ``RuntimeError`` if neither source provides a key.
+    Memoized: the key cannot change mid-process, so the config file is
+    read at most once.
     """
     key = os.environ.get("OPENAI_API_KEY")
     if key:
@@ -37,9 +99,696 @@ def load_openai_key() -> str:
     )
 
 
+# Semantic caches for the chatty read paths: the exact-match cache in
+# llm_cache misses on reworded reposts, these catch them.
+_comment_sem_cache = semantic_cache.SemanticCache()
+_answer_sem_cache = semantic_cache.SemanticCache()
+
+
+# Pro-active pacing for the async fan-out paths: staying under the
+# account RPM/TPM caps keeps the pipe saturated, where tripping 429s
+# wastes wall-clock in retry backoff. Defaults are deliberately below
+# typical account limits; override via OUROBOROS_RPM / OUROBOROS_TPM.
+_DEFAULT_RPM = 300
+_DEFAULT_TPM = 150_000
+
+
+class _AsyncBucket:
+    """Minimal token bucket refilled over a 60-second window."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self._level = per_minute
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        amount = min(amount, self.per_minute)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._level = min(
+                    self.per_minute,
+                    self._level + (now - self._updated) * self.per_minute / 60.0,
+                )
+                self._updated = now
+                if self._level >= amount:
+                    self._level -= amount
+                    return
+                await asyncio.sleep((amount - self._level) * 60.0 / self.per_minute)
+
+
+# One (rpm, tpm) bucket pair per model: gpt-4o and gpt-4o-mini draw from
+# separate account pools, so they must not throttle each other.
+_limiters: Dict[str, Tuple[_AsyncBucket, _AsyncBucket]] = {}
+
+
+def _estimate_tokens(messages: list, max_tokens: int) -> int:
+    """Rough token estimate: ~4 chars per token plus per-message overhead.
+
+    A tokenizer would be exact, but for pacing an over-estimate that errs
+    a few percent high is all the bucket needs.
+    """
+    chars = sum(len(m.get("content") or "") for m in messages)
+    return chars // 4 + 4 * len(messages) + max_tokens
+
+
+async def _throttle(model: str, messages: list, max_tokens: int) -> None:
+    """Debit one request and its estimated tokens from the model's buckets."""
+    pair = _limiters.get(model)
+    if pair is None:
+        rpm = float(os.environ.get("OUROBOROS_RPM", _DEFAULT_RPM))
+        tpm = float(os.environ.get("OUROBOROS_TPM", _DEFAULT_TPM))
+        pair = _limiters.setdefault(model, (_AsyncBucket(rpm), _AsyncBucket(tpm)))
+    await pair[0].acquire()
+    await pair[1].acquire(_estimate_tokens(messages, max_tokens))
+
+
+# Transient API failures are retried with jittered exponential backoff
+# instead of dropping the whole unit of work: a single 429 or blip of
+# packet loss used to cost the entire analyze/plan/generate pipeline a
+# rerun. Only errors the next attempt can plausibly survive are retried;
+# BadRequestError and malformed-JSON responses still fail fast through
+# the callers' existing except blocks.
+_RETRY_ATTEMPTS = 6
+_RETRY_MAX_SLEEP = 60.0
+
+
+# Per-function token accounting, including how many prompt tokens the
+# provider served from its prefix cache. Without this there is no way to
+# tell whether the static-first message ordering and session prefixes
+# are actually earning the cached-prompt discount, or which helper to
+# route toward when they are. Keys are (fn_name, model, field).
+usage: collections.Counter = collections.Counter()
+
+
+def _usage_int(value) -> int:
+    """Usage fields from test doubles may not be ints; count those as 0."""
+    return value if isinstance(value, int) else 0
+
+
+def _caller_name(frame) -> str:
+    """Nearest non-underscore function up the stack -- the public LLM
+    helper on whose behalf a create call is being made."""
+    while frame is not None:
+        name = frame.f_code.co_name
+        if not name.startswith("_"):
+            return name
+        frame = frame.f_back
+    return "unknown"
+
+
+def _record_usage(fn_name: str, model: str, resp) -> None:
+    """Accumulate prompt/cached/completion token counts for one response."""
+    u = getattr(resp, "usage", None)
+    if u is None:
+        return
+    details = getattr(u, "prompt_tokens_details", None)
+    usage[(fn_name, model, "prompt")] += _usage_int(getattr(u, "prompt_tokens", 0))
+    usage[(fn_name, model, "cached")] += _usage_int(getattr(details, "cached_tokens", 0))
+    usage[(fn_name, model, "completion")] += _usage_int(getattr(u, "completion_tokens", 0))
+
+
+def get_cache_hit_ratio(fn_name: str) -> float:
+    """Fraction of `fn_name`'s prompt tokens served from the provider's
+    prefix cache, across models; 0.0 before any usage is recorded."""
+    prompt = sum(v for (fn, _, field), v in usage.items() if fn == fn_name and field == "prompt")
+    cached = sum(v for (fn, _, field), v in usage.items() if fn == fn_name and field == "cached")
+    if prompt == 0:
+        return 0.0
+    return cached / prompt
+
+
+@functools.lru_cache(maxsize=1)
+def _retriable_errors() -> tuple:
+    """Exception types worth retrying; resolved on first use so that
+    importing this module does not pay for the openai/pydantic import."""
+    from openai import (
+        APIConnectionError,
+        APITimeoutError,
+        InternalServerError,
+        RateLimitError,
+    )
+
+    return (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+
+@functools.lru_cache(maxsize=1)
+def _stream_fallback_errors() -> tuple:
+    """Errors that mean "retry this request without streaming"."""
+    from openai import BadRequestError
+
+    return (BadRequestError, TypeError)
+
+
+def _retry_sleep(attempt: int) -> float:
+    """Randomized exponential delay; the jitter decorrelates clients that
+    all saw the same 429 at the same moment."""
+    return max(1.0, random.uniform(0, min(_RETRY_MAX_SLEEP, 2.0 ** attempt)))
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Delay before the next attempt; a server-provided Retry-After
+    header wins over the computed backoff."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is not None:
+        try:
+            value = headers.get("retry-after")
+            if value:
+                return min(_RETRY_MAX_SLEEP, float(value))
+        except (AttributeError, TypeError, ValueError):
+            pass
+    return _retry_sleep(attempt)
+
+
+class BreakerOpenError(RuntimeError):
+    """Raised instead of making a network call while the circuit is open."""
+
+
+@dataclass
+class _Breaker:
+    """Circuit breaker shared by every create call.
+
+    During a sustained provider outage each wrapper would otherwise pay
+    the full retry schedule before returning None. After
+    `failure_threshold` consecutive transient failures the circuit
+    opens and calls fail immediately; once `reset_timeout` has passed,
+    probes are let through again and the first success re-closes it.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    failures: int = 0
+    opened_at: Optional[float] = None
+
+    def check(self) -> None:
+        """Raise BreakerOpenError if calls should be short-circuited."""
+        if self.opened_at is None:
+            return
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return  # half-open: allow a probe through
+        raise BreakerOpenError("LLM circuit open; skipping call")
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                log.warning(
+                    "LLM circuit opened after %d consecutive transient "
+                    "failures; short-circuiting calls for %.0fs",
+                    self.failures, self.reset_timeout,
+                )
+            self.opened_at = time.monotonic()
+
+
+_breaker = _Breaker()
+
+
+def _create_with_retry(client: OpenAI, **kwargs):
+    """chat.completions.create with typed retry on transient failures."""
+    _breaker.check()
+    for attempt in range(1, _RETRY_ATTEMPTS + 1):
+        try:
+            resp = client.chat.completions.create(**kwargs)
+            _breaker.record_success()
+            if not kwargs.get("stream"):
+                _record_usage(
+                    _caller_name(sys._getframe(1)), kwargs.get("model", ""), resp
+                )
+            return resp
+        except _retriable_errors() as exc:
+            _breaker.record_failure()
+            if attempt == _RETRY_ATTEMPTS:
+                raise
+            delay = _retry_delay(exc, attempt)
+            log.warning(
+                "LLM call hit %s; retry %d/%d in %.1fs",
+                type(exc).__name__, attempt, _RETRY_ATTEMPTS - 1, delay,
+            )
+            time.sleep(delay)
+
+
+async def _acreate_with_retry(client: AsyncOpenAI, **kwargs):
+    """Async twin of _create_with_retry; sleeps without blocking the loop."""
+    _breaker.check()
+    for attempt in range(1, _RETRY_ATTEMPTS + 1):
+        try:
+            resp = await client.chat.completions.create(**kwargs)
+            _breaker.record_success()
+            if not kwargs.get("stream"):
+                _record_usage(
+                    _caller_name(sys._getframe(1)), kwargs.get("model", ""), resp
+                )
+            return resp
+        except _retriable_errors() as exc:
+            _breaker.record_failure()
+            if attempt == _RETRY_ATTEMPTS:
+                raise
+            delay = _retry_delay(exc, attempt)
+            log.warning(
+                "LLM call hit %s; retry %d/%d in %.1fs",
+                type(exc).__name__, attempt, _RETRY_ATTEMPTS - 1, delay,
+            )
+            await asyncio.sleep(delay)
+
+
+# Structured output used to rely on response_format=json_object plus a
+# client-side json.loads that failed silently (returning None) on the
+# occasional malformed blob -- re-triggering the whole upstream pipeline.
+# Forcing a single strict function call makes the server constrain
+# decoding to the schema, so the 1-3% parse-failure rework disappears
+# and the output shape stays stable across model minor versions.
+
+_CODE_CHANGES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "changes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "file_path": {"type": "string"},
+                    "new_content": {"type": "string"},
+                    "description": {"type": "string"},
+                },
+                "required": ["file_path", "new_content", "description"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["changes"],
+    "additionalProperties": False,
+}
+
+_TASK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "task_type": {
+            "type": "string",
+            "enum": ["fix_test", "add_test", "fix_bug", "none"],
+        },
+        "description": {"type": "string"},
+        "target_files": {"type": "array", "items": {"type": "string"}},
+        "evidence": {"type": "string"},
+        "priority": {"type": "string", "enum": ["high", "medium", "low"]},
+    },
+    "required": ["task_type", "description", "target_files", "evidence", "priority"],
+    "additionalProperties": False,
+}
+
+_POST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "content": {"type": "string"},
+    },
+    "required": ["title", "content"],
+    "additionalProperties": False,
+}
+
+_INSIGHTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "insights": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "post_index": {"type": "integer"},
+                    "insight": {"type": "string"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["post_index", "insight", "tags"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["insights"],
+    "additionalProperties": False,
+}
+
+_SUGGESTIONS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "suggestions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "author": {"type": "string"},
+                    "comment_id": {"type": "string"},
+                    "approach": {"type": "string"},
+                    "code_snippets": {"type": "array", "items": {"type": "string"}},
+                    "target_files": {"type": "array", "items": {"type": "string"}},
+                    "confidence": {"type": "number"},
+                },
+                "required": [
+                    "author", "comment_id", "approach",
+                    "code_snippets", "target_files", "confidence",
+                ],
+                "additionalProperties": False,
+            },
+        },
+        "has_actionable": {"type": "boolean"},
+    },
+    "required": ["suggestions", "has_actionable"],
+    "additionalProperties": False,
+}
+
+# config_changes is an open key-value map, which strict mode cannot
+# express; this one stays non-strict but still schema-guided.
+_UPGRADES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "has_suggestions": {"type": "boolean"},
+        "suggestions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "type": {"type": "string"},
+                    "description": {"type": "string"},
+                    "config_changes": {"type": "object"},
+                    "commenter": {"type": "string"},
+                },
+                "required": ["type", "description"],
+            },
+        },
+    },
+    "required": ["has_suggestions", "suggestions"],
+}
+
+
+def _tool_kwargs(name: str, schema: dict, strict: bool = True) -> dict:
+    """tools/tool_choice kwargs forcing one function call with `schema`."""
+    fn = {"name": name, "parameters": schema}
+    if strict:
+        fn["strict"] = True
+    return {
+        "tools": [{"type": "function", "function": fn}],
+        "tool_choice": {"type": "function", "function": {"name": name}},
+    }
+
+
+def _tool_args(resp) -> Optional[str]:
+    """The forced function call's argument blob from a completion.
+
+    Falls back to message content for servers (or test doubles) that
+    answered inline instead of via the tool call. A refusal is returned
+    as None immediately -- feeding the refusal text to the JSON parser
+    would only swap a clear log line for a decode traceback.
+    """
+    msg = resp.choices[0].message
+    refusal = getattr(msg, "refusal", None)
+    if isinstance(refusal, str) and refusal:
+        log.warning("Model refused the request: %s", refusal)
+        return None
+    calls = getattr(msg, "tool_calls", None)
+    if calls:
+        return calls[0].function.arguments
+    return msg.content
+
+
+def _stream_tool_args(client: OpenAI, **kwargs) -> Optional[str]:
+    """Streaming twin of _tool_args: concatenates argument fragments.
+
+    For the long outputs (generate_code at 2000 max_tokens) streaming
+    overlaps network transfer with our own buffering and surfaces a
+    truncated or failing response at the first bad chunk instead of
+    after the last token; here the fragments come from delta.tool_calls
+    rather than delta.content. Falls back to the non-streaming endpoint
+    if the server rejects the combination.
+    """
+    try:
+        stream = _create_with_retry(client, stream=True, **kwargs)
+        parts = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            calls = getattr(delta, "tool_calls", None)
+            if calls:
+                fragment = calls[0].function.arguments
+                if fragment:
+                    parts.append(fragment)
+            elif getattr(delta, "content", None):
+                parts.append(delta.content)
+        return "".join(parts)
+    except _stream_fallback_errors():
+        log.debug("Streaming unsupported for this request shape; falling back")
+        resp = _create_with_retry(client, **kwargs)
+        return _tool_args(resp)
+
+
+# The knowledge-base refresh flows run in background loops where hours
+# of latency are fine. Routing them through the Batch API halves token
+# cost and draws from a separate rate-limit pool, so they stop competing
+# with the latency-sensitive comment path. Opt in with
+# OUROBOROS_USE_BATCH=1; OUROBOROS_BATCH_WAIT caps how long we wait.
+
+
+def _batch_enabled() -> bool:
+    return os.environ.get("OUROBOROS_USE_BATCH") == "1"
+
+
+def submit_batch(client: OpenAI, requests: list) -> Optional[str]:
+    """Submit chat requests through the Batch API; returns the batch id.
+
+    Each entry needs a `custom_id` and a chat.completions `body`. The
+    JSONL input file is written to a temp path, uploaded, and deleted.
+    Returns None on failure.
+    """
+    try:
+        lines = [
+            _dumps(
+                {
+                    "custom_id": r["custom_id"],
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": r["body"],
+                }
+            )
+            for r in requests
+        ]
+        path = os.path.join(
+            tempfile.gettempdir(), f"ouroboros-batch-{uuid.uuid4().hex}.jsonl"
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+        try:
+            with open(path, "rb") as f:
+                uploaded = client.files.create(file=f, purpose="batch")
+        finally:
+            os.unlink(path)
+        batch = client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+    except Exception:
+        log.exception("submit_batch failed")
+        return None
+
+
+def poll_batch(client: OpenAI, batch_id: str) -> Optional[Dict[str, str]]:
+    """Reap a batch: map custom_id -> message content once it completes.
+
+    Returns None while the batch is still running, and {} when it ended
+    without usable output (failed/expired/cancelled).
+    """
+    try:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            log.warning("Batch %s ended with status %s", batch_id, batch.status)
+            return {}
+        if batch.status != "completed" or not batch.output_file_id:
+            return None
+        raw = client.files.content(batch.output_file_id).text
+        results: Dict[str, str] = {}
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            rec = _loads(line)
+            try:
+                results[rec["custom_id"]] = (
+                    rec["response"]["body"]["choices"][0]["message"]["content"]
+                )
+            except (KeyError, IndexError, TypeError):
+                continue
+        return results
+    except Exception:
+        log.exception("poll_batch failed")
+        return None
+
+
+def _run_via_batch(client: OpenAI, body: dict) -> Optional[str]:
+    """Run one chat body through the Batch API, waiting for the result.
+
+    Polls until OUROBOROS_BATCH_WAIT seconds (default 900) have passed;
+    returns None on timeout or failure so callers fall back to the
+    synchronous endpoint.
+    """
+    batch_id = submit_batch(client, [{"custom_id": "0", "body": body}])
+    if batch_id is None:
+        return None
+    deadline = time.monotonic() + float(os.environ.get("OUROBOROS_BATCH_WAIT", "900"))
+    while time.monotonic() < deadline:
+        results = poll_batch(client, batch_id)
+        if results == {}:
+            return None
+        if results is not None:
+            return results.get("0")
+        time.sleep(30)
+    log.warning("Batch %s not finished within the wait window", batch_id)
+    return None
+
+
+@functools.lru_cache(maxsize=2)
 def make_client(api_key: str) -> OpenAI:
-    """Create a reusable OpenAI client instance."""
-    return OpenAI(api_key=api_key)
+    """Create a reusable OpenAI client instance.
+
+    Memoized so repeat callers share one client and therefore one HTTP
+    connection pool -- a fresh pool pays a TLS handshake on its first
+    request. When httpx[http2] is available the pool speaks HTTP/2 with
+    generous keep-alive, so sequential calls reuse warm connections
+    instead of re-handshaking. SDK-internal retries are disabled;
+    _create_with_retry owns retry policy so failures aren't retried
+    twice.
+    """
+    from openai import OpenAI
+
+    transport = _http2_transport()
+    if transport is not None:
+        return OpenAI(api_key=api_key, http_client=transport, max_retries=0)
+    return OpenAI(api_key=api_key, max_retries=0)
+
+
+def get_default_client() -> OpenAI:
+    """The process-wide client: discovered key, shared connection pool."""
+    return make_client(load_openai_key())
+
+
+def _http2_transport() -> Optional[object]:
+    """Sync twin of _http2_async_transport, for make_client."""
+    if httpx is None:
+        return None
+    try:
+        return httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+    except ImportError:  # h2 extra not installed
+        return None
+
+
+def _http2_async_transport() -> Optional[object]:
+    """Build an HTTP/2 httpx.AsyncClient for the OpenAI SDK, if possible.
+
+    The SDK's default transport speaks HTTP/1.1, so under gather-style
+    fan-out each concurrent request needs its own TCP connection -- a
+    TLS handshake per new connection and head-of-line blocking at the
+    pool limit. With http2=True all in-flight calls multiplex over a
+    handful of connections. Returns None when httpx or its h2 extra is
+    not installed; the SDK default is used instead.
+    """
+    if httpx is None:
+        return None
+    try:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+            timeout=httpx.Timeout(60, connect=5),
+        )
+    except ImportError:  # h2 extra not installed
+        return None
+
+
+def make_async_client(api_key: str) -> AsyncOpenAI:
+    """Create a reusable async OpenAI client for fan-out callers.
+
+    The workload is pure network I/O, so N awaited requests overlap on a
+    single thread instead of serializing at seconds per call. When
+    httpx[http2] is available the client gets an HTTP/2 transport (see
+    _http2_async_transport); close it via aclose_client on shutdown.
+    """
+    from openai import AsyncOpenAI
+
+    transport = _http2_async_transport()
+    if transport is not None:
+        return AsyncOpenAI(api_key=api_key, http_client=transport, max_retries=0)
+    return AsyncOpenAI(api_key=api_key)
+
+
+async def aclose_client(client: AsyncOpenAI) -> None:
+    """Close an async client's connection pool on shutdown."""
+    try:
+        await client.close()
+    except Exception:
+        log.debug("Async client close failed", exc_info=True)
+
+
+# Local pre-filter for generate_comment: posts with no technical markers
+# and heavy fluff vocabulary used to pay a full LLM round-trip just to
+# come back as SKIP. The heuristic only vetoes the obvious cases -- any
+# technical marker, or too little text to judge, still goes to the model.
+_TECH_MARKER_RE = re.compile(
+    r"```|[a-z0-9_]+\.(?:py|js|ts|rs|go|c|cpp|h|rb|java|sql|toml|yaml|yml|json)\b"
+    r"|\b[a-z0-9]+_[a-z0-9_]+\b|\b[a-z]+[A-Z][a-zA-Z]+\b"
+    r"|\b(?:api|cache|latency|throughput|database|sql|async|thread|cpu|memory"
+    r"|benchmark|compiler?|regex|docker|kubernetes|server|deploy|bug|refactor"
+    r"|algorithm|queue|index|schema|endpoint|token|vector|pipeline|git)\b"
+)
+_FLUFF_MARKER_RE = re.compile(
+    r"\b(?:blessed|grateful|gratitude|journey|manifest(?:ing)?|mindset"
+    r"|inspiration(?:al)?|motivat(?:ion|ed|ional)|hustle|vibes?|soul"
+    r"|dream\s+big|believe\s+in\s+yourself|self[- ]care|abundance|universe)\b",
+    re.IGNORECASE,
+)
+_MIN_CLASSIFIABLE_CHARS = 40
+
+
+def _looks_technical(post_title: str, post_content: str) -> bool:
+    """Cheap local guess at whether a post merits an LLM comment pass.
+
+    Returns False only for clearly non-technical posts: enough text to
+    judge, at least two fluff markers, and not a single technical one.
+    Everything ambiguous returns True -- this gates the obvious cases,
+    the model still makes the real decision.
+    """
+    text = f"{post_title}\n{post_content}"
+    if len(text) < _MIN_CLASSIFIABLE_CHARS:
+        return True
+    if _TECH_MARKER_RE.search(text):
+        return True
+    return len(_FLUFF_MARKER_RE.findall(text)) < 2
+
+
+def _comment_messages(post_title: str, post_content: str) -> list:
+    """Messages for a comment request; shared by the sync and async paths."""
+    return [
+        {
+            "role": "system",
+            "content": _COMMENT_SYS_PROMPT,
+        },
+        {
+            "role": "user",
+            "content": f"Post title: {post_title}\n\nPost content: {post_content}",
+        },
+    ]
+
+
+def _finish_comment(text: Optional[str], post_title: str) -> Optional[str]:
+    """Map the SKIP sentinel to None; shared by the sync and async paths."""
+    if text and text.strip().upper() == "SKIP":
+        log.info("Skipping non-technical post: %s", post_title[:80])
+        return None
+    return text
 
 
 def generate_comment(
@@ -52,72 +801,421 @@ def generate_comment(
 
     Returns None if the LLM decides the post isn't worth commenting on
     (non-technical, fluff) or on failure.
+
+    Repeated prompts (re-seen posts) are answered from the exact-match
+    cache; the SKIP sentinel is cached too, since it is a model decision
+    rather than a failure.
     """
+    if not _looks_technical(post_title, post_content):
+        log.info("Local filter skipped non-technical post: %s", post_title[:80])
+        return None
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            max_tokens=150,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_comment_system_prompt(),
-                },
-                {
-                    "role": "user",
-                    "content": f"Post title: {post_title}\n\nPost content: {post_content}",
-                },
-            ],
-        )
-        text = resp.choices[0].message.content
-        if text and text.strip().upper() == "SKIP":
-            log.info("Skipping non-technical post: %s", post_title[:80])
-            return None
-        return text
+        messages = _comment_messages(post_title, post_content)
+        payload = {"model": model, "messages": messages, "max_tokens": 150}
+        text = llm_cache.get(payload)
+        vec = None
+        if text is None:
+            vec = semantic_cache.embed(f"{post_title}\n{post_content}")
+            text = _comment_sem_cache.get(vec)
+        if text is None:
+            resp = _create_with_retry(
+                client,
+                model=model,
+                max_tokens=150,
+                messages=messages,
+            )
+            text = resp.choices[0].message.content
+            if text:
+                llm_cache.put(payload, text)
+                _comment_sem_cache.put(vec, text)
+        return _finish_comment(text, post_title)
     except Exception:
         log.exception("generate_comment failed")
         return None
 
 
+async def generate_comment_async(
+    client: AsyncOpenAI,
+    post_title: str,
+    post_content: str,
+    model: str = "gpt-4o-mini",
+) -> Optional[str]:
+    """Async variant of generate_comment, for gather-style fan-out."""
+    if not _looks_technical(post_title, post_content):
+        log.info("Local filter skipped non-technical post: %s", post_title[:80])
+        return None
+    try:
+        messages = _comment_messages(post_title, post_content)
+        payload = {"model": model, "messages": messages, "max_tokens": 150}
+        text = llm_cache.get(payload)
+        vec = None
+        if text is None:
+            vec = semantic_cache.embed(f"{post_title}\n{post_content}")
+            text = _comment_sem_cache.get(vec)
+        if text is None:
+            await _throttle(model, messages, 150)
+            resp = await _acreate_with_retry(
+                client,
+                model=model,
+                max_tokens=150,
+                messages=messages,
+            )
+            text = resp.choices[0].message.content
+            if text:
+                llm_cache.put(payload, text)
+                _comment_sem_cache.put(vec, text)
+        return _finish_comment(text, post_title)
+    except Exception:
+        log.exception("generate_comment_async failed")
+        return None
+
+
+_BULK_COMMENTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "comments": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["comments"],
+    "additionalProperties": False,
+}
+
+
+def generate_comments_bulk(
+    client: OpenAI,
+    posts: list,
+    model: str = "gpt-4o-mini",
+) -> list:
+    """Comment on many posts with one request instead of one per post.
+
+    Takes (title, content) pairs and returns one entry per post in
+    order, None where skipped or failed. When the account is RPM-bound
+    rather than TPM-bound, packing K posts into a single request
+    recovers K-1 round-trips and K-1 request-quota units. Posts the
+    local filter rejects are never sent; if the model returns the wrong
+    number of comments the whole batch falls back to per-post calls.
+    """
+    results = [None] * len(posts)
+    send = [
+        i for i, (title, content) in enumerate(posts)
+        if _looks_technical(title, content)
+    ]
+    if not send:
+        return results
+    try:
+        buf = io.StringIO()
+        for n, i in enumerate(send, start=1):
+            title, content = posts[i]
+            buf.write(f"Post {n} title: {title}\nPost {n} content: {content}\n\n")
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    _COMMENT_SYS_PROMPT
+                    + f"\n\nYou will receive {len(send)} posts. Respond with JSON "
+                    '{"comments": [...]} holding exactly one entry per post, in '
+                    'order. Use the string "SKIP" for posts not worth commenting on.'
+                ),
+            },
+            {"role": "user", "content": buf.getvalue()},
+        ]
+        resp = _create_with_retry(
+            client,
+            model=model,
+            max_tokens=150 * len(send),
+            **_tool_kwargs("emit_comments", _BULK_COMMENTS_SCHEMA),
+            messages=messages,
+        )
+        comments = _loads(_tool_args(resp)).get("comments")
+        if not isinstance(comments, list) or len(comments) != len(send):
+            raise ValueError(f"expected {len(send)} comments, got {comments!r}")
+        for i, text in zip(send, comments):
+            title = posts[i][0]
+            results[i] = _finish_comment(text, title)
+        return results
+    except Exception:
+        log.exception("generate_comments_bulk failed; falling back to per-post calls")
+        for i in send:
+            title, content = posts[i]
+            results[i] = generate_comment(client, title, content, model=model)
+        return results
+
+
+def _iter_stream(client: OpenAI, **kwargs):
+    """Yield content deltas from a streaming completion."""
+    stream = _create_with_retry(client, stream=True, **kwargs)
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        piece = getattr(chunk.choices[0].delta, "content", None)
+        if piece:
+            yield piece
+
+
+def generate_comment_stream(
+    client: OpenAI,
+    post_title: str,
+    post_content: str,
+    model: str = "gpt-4o-mini",
+):
+    """Yield comment text incrementally as the model generates it.
+
+    Time-to-first-token drops to roughly one round-trip instead of the
+    full generation time, which is what an interactive caller perceives
+    as latency. Cache hits (exact or semantic) yield the stored text in
+    one piece. The SKIP sentinel streams through verbatim -- callers
+    that want the None mapping should use generate_comment.
+    """
+    if not _looks_technical(post_title, post_content):
+        log.info("Local filter skipped non-technical post: %s", post_title[:80])
+        return
+    messages = _comment_messages(post_title, post_content)
+    payload = {"model": model, "messages": messages, "max_tokens": 150}
+    text = llm_cache.get(payload)
+    vec = None
+    if text is None:
+        vec = semantic_cache.embed(f"{post_title}\n{post_content}")
+        text = _comment_sem_cache.get(vec)
+    if text is not None:
+        yield text
+        return
+    parts = []
+    for piece in _iter_stream(client, model=model, max_tokens=150, messages=messages):
+        parts.append(piece)
+        yield piece
+    text = "".join(parts)
+    if text:
+        llm_cache.put(payload, text)
+        _comment_sem_cache.put(vec, text)
+
+
+def answer_question_stream(
+    client: OpenAI,
+    question: str,
+    codebase_summary: str = "",
+    model: str = "gpt-4o-mini",
+    session: Optional[Session] = None,
+):
+    """Yield answer text incrementally; see generate_comment_stream."""
+    user_content = _answer_user_content(question, codebase_summary)
+    vec = semantic_cache.embed(question)
+    fp = _answer_fingerprint(codebase_summary)
+    cached = _answer_cached(vec, fp)
+    if cached is not None:
+        yield cached
+        return
+    messages = _with_session(session, _answer_messages(user_content))
+    parts = []
+    for piece in _iter_stream(client, model=model, max_tokens=300, messages=messages):
+        parts.append(piece)
+        yield piece
+    text = "".join(parts)
+    if text:
+        _answer_sem_cache.put(vec, (fp, text))
+
+
+async def generate_comments_many(
+    client: AsyncOpenAI,
+    posts: list,
+    model: str = "gpt-4o-mini",
+) -> list:
+    """Generate comments for many posts concurrently.
+
+    Takes post dicts (title/content keys) and returns one result per post
+    in order; entries are None where the post was skipped or failed.
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                generate_comment_async(
+                    client, p.get("title", ""), p.get("content", ""), model=model
+                )
+                for p in posts
+            )
+        )
+    )
+
+
+_DEFAULT_CONCURRENCY = 16
+
+
+async def run_many(client: AsyncOpenAI, tasks: list) -> list:
+    """Run many wrapper calls concurrently with bounded fan-out.
+
+    Each task is ``{"fn": <async wrapper>, "kwargs": {...}}``; results
+    come back in task order, None where a call failed (matching the
+    wrappers' own contract). Pacing against the account RPM/TPM caps
+    and transient-error retry already live inside the wrappers, so this
+    driver only bounds how many calls are in flight at once
+    (OUROBOROS_CONCURRENCY, default 16) to keep memory and connection
+    use flat on large batches. Finished calls land in the persistent
+    llm_cache, so a crashed batch resumes without re-paying for work
+    already done.
+    """
+    limit = int(os.environ.get("OUROBOROS_CONCURRENCY", _DEFAULT_CONCURRENCY))
+    sem = asyncio.Semaphore(limit)
+
+    async def _one(task: dict):
+        async with sem:
+            try:
+                return await task["fn"](client, **task.get("kwargs", {}))
+            except Exception:
+                fn = task.get("fn")
+                log.exception("run_many task failed: %s", getattr(fn, "__name__", fn))
+                return None
+
+    return list(await asyncio.gather(*(_one(t) for t in tasks)))
+
+
+@dataclass
+class Session:
+    """Stable prompt prefix shared by every call in one session.
+
+    Long, unchanging context (the codebase summary, the safety
+    constraints) used to be re-embedded into each call's user message,
+    so no two calls shared a byte-identical prefix and the provider's
+    automatic prompt cache never engaged. Holding that context in
+    system blocks that each call prepends verbatim -- static blocks
+    first, per-call content last -- earns the cached-prompt discount on
+    every call after the first.
+    """
+
+    system_blocks: List[dict] = field(default_factory=list)
+
+    def add_block(self, content: str) -> None:
+        """Append one system block; add in most-static-first order."""
+        self.system_blocks.append({"role": "system", "content": content})
+
+
+def _with_session(session: Optional[Session], messages: list) -> list:
+    """Prepend the session's system blocks, if a session is in use."""
+    if session is not None and session.system_blocks:
+        return session.system_blocks + messages
+    return messages
+
+
+_ANSWER_SYS_PROMPT = (
+    "You are a self-reflective agent analyzing your own "
+    "codebase, design, safety properties, and potential improvements. "
+    "Answer based ONLY on the provided codebase. "
+    "Reference specific files, functions, and code patterns. "
+    "Do NOT give generic advice. Be concrete and actionable."
+)
+
+
+def _answer_user_content(question: str, codebase_summary: str) -> str:
+    if codebase_summary:
+        return f"## Codebase\n{codebase_summary}\n\n## Question\n{question}"
+    return question
+
+
+def _answer_fingerprint(codebase_summary: str) -> str:
+    """Exact digest of the summary, stored beside each cached answer.
+
+    The semantic vector covers only the question: with the bag-of-words
+    embedding, a multi-KB summary would dominate the vector and make
+    distinct questions over the same summary look identical. The
+    summary itself must match exactly for a hit, hence the digest.
+    """
+    return hashlib.blake2b(codebase_summary.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _answer_cached(vec: list, fp: str) -> Optional[str]:
+    """Semantic-cache lookup scoped to one summary fingerprint."""
+    hit = _answer_sem_cache.get(vec)
+    if hit is not None and hit[0] == fp:
+        return hit[1]
+    return None
+
+
+def _answer_messages(user_content: str) -> list:
+    """Messages for a design question; shared by the sync and async paths."""
+    return [
+        {"role": "system", "content": _ANSWER_SYS_PROMPT},
+        {"role": "user", "content": user_content},
+    ]
+
+
 def answer_question(
     client: OpenAI,
     question: str,
     codebase_summary: str = "",
     model: str = "gpt-4o-mini",
+    session: Optional[Session] = None,
 ) -> Optional[str]:
     """Answer a self-reflective question about the agent's own design.
 
     Returns None on failure.
     """
-    user_content = question
-    if codebase_summary:
-        user_content = (
-            f"## Codebase\n{codebase_summary}\n\n"
-            f"## Question\n{question}"
-        )
+    user_content = _answer_user_content(question, codebase_summary)
+    # Paraphrased repeats of the same question over the same summary
+    # are answered from the semantic cache.
+    vec = semantic_cache.embed(question)
+    fp = _answer_fingerprint(codebase_summary)
+    cached = _answer_cached(vec, fp)
+    if cached is not None:
+        return cached
     try:
-        resp = client.chat.completions.create(
+        resp = _create_with_retry(
+            client,
             model=model,
             max_tokens=300,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a self-reflective agent analyzing your own "
-                        "codebase, design, safety properties, and potential improvements. "
-                        "Answer based ONLY on the provided codebase. "
-                        "Reference specific files, functions, and code patterns. "
-                        "Do NOT give generic advice. Be concrete and actionable."
-                    ),
-                },
-                {"role": "user", "content": user_content},
-            ],
+            messages=_with_session(session, _answer_messages(user_content)),
         )
-        return resp.choices[0].message.content
+        text = resp.choices[0].message.content
+        if text:
+            _answer_sem_cache.put(vec, (fp, text))
+        return text
     except Exception:
         log.exception("answer_question failed")
         return None
 
 
+async def answer_question_async(
+    client: AsyncOpenAI,
+    question: str,
+    codebase_summary: str = "",
+    model: str = "gpt-4o-mini",
+    session: Optional[Session] = None,
+) -> Optional[str]:
+    """Async variant of answer_question, for gather-style fan-out."""
+    user_content = _answer_user_content(question, codebase_summary)
+    vec = semantic_cache.embed(question)
+    fp = _answer_fingerprint(codebase_summary)
+    cached = _answer_cached(vec, fp)
+    if cached is not None:
+        return cached
+    try:
+        messages = _with_session(session, _answer_messages(user_content))
+        await _throttle(model, messages, 300)
+        resp = await _acreate_with_retry(
+            client,
+            model=model,
+            max_tokens=300,
+            messages=messages,
+        )
+        text = resp.choices[0].message.content
+        if text:
+            _answer_sem_cache.put(vec, (fp, text))
+        return text
+    except Exception:
+        log.exception("answer_question_async failed")
+        return None
+
+
+def _post_messages(recent_answer: str, question_area: str) -> list:
+    """Messages for an autonomous post; shared by the sync and async paths."""
+    return [
+        {
+            "role": "system",
+            "content": _POST_GEN_PROMPT,
+        },
+        {
+            "role": "user",
+            "content": prompts.load_post_context_prompt(recent_answer, question_area),
+        },
+    ]
+
+
 def generate_post(
     client: OpenAI,
     recent_answer: str,
@@ -129,28 +1227,78 @@ def generate_post(
     Returns dict with 'title' and 'content' keys, or None on failure.
     """
     try:
-        resp = client.chat.completions.create(
+        resp = _create_with_retry(
+            client,
             model=model,
             max_tokens=500,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_post_generation_prompt(),
-                },
-                {
-                    "role": "user",
-                    "content": prompts.load_post_context_prompt(recent_answer, question_area),
-                },
-            ],
+            **_tool_kwargs("emit_post", _POST_SCHEMA),
+            messages=_post_messages(recent_answer, question_area),
         )
-        content = resp.choices[0].message.content
-        return json.loads(content)
+        return _loads(_tool_args(resp))
     except Exception:
         log.exception("generate_post failed")
         return None
 
 
+async def generate_post_async(
+    client: AsyncOpenAI,
+    recent_answer: str,
+    question_area: str,
+    model: str = "gpt-4o-mini",
+) -> Optional[dict]:
+    """Async variant of generate_post, for gather-style fan-out."""
+    try:
+        messages = _post_messages(recent_answer, question_area)
+        await _throttle(model, messages, 500)
+        resp = await _acreate_with_retry(
+            client,
+            model=model,
+            max_tokens=500,
+            **_tool_kwargs("emit_post", _POST_SCHEMA),
+            messages=messages,
+        )
+        return _loads(_tool_args(resp))
+    except Exception:
+        log.exception("generate_post_async failed")
+        return None
+
+
+_ANALYZE_SYS_PROMPT = (
+    "You are a code quality analyst. You identify ONE concrete, "
+    "small improvement to make to a Python codebase. Focus on:\n"
+    "1. Fixing failing tests (fix_test)\n"
+    "2. Adding missing test coverage (add_test)\n"
+    "3. Fixing clear bugs (fix_bug)\n\n"
+    "You may receive External Context from community posts. "
+    "Use it to prioritize improvements aligned with community interest.\n\n"
+    "Output JSON with keys:\n"
+    "- task_type: one of 'fix_test', 'add_test', 'fix_bug'\n"
+    "- description: what to fix/add (1-2 sentences)\n"
+    "- target_files: list of file paths to modify\n"
+    "- evidence: why this improvement is needed\n"
+    "- priority: 'high', 'medium', or 'low'\n\n"
+    "If no improvements are needed, return {\"task_type\": \"none\", \"description\": \"No improvements needed\"}.\n"
+    "IMPORTANT: Never suggest modifying config.py, improvement.py, git_ops.py, evaluation.py, or policies.py."
+)
+
+
+def _analyze_messages(
+    summary: str, test_results: str, history: str, additional_context: str
+) -> list:
+    """Messages for codebase analysis; shared by the sync and async paths."""
+    user_content = (
+        f"## Codebase Summary\n{summary}\n\n"
+        f"## Test Results\n{test_results}\n\n"
+        f"## Improvement History\n{history}"
+    )
+    if additional_context:
+        user_content += f"\n\n## External Context\n{additional_context}"
+    return [
+        {"role": "system", "content": _ANALYZE_SYS_PROMPT},
+        {"role": "user", "content": user_content},
+    ]
+
+
 def analyze_codebase(
     client: OpenAI,
     summary: str,
@@ -158,59 +1306,114 @@ def analyze_codebase(
     history: str,
     model: str = "gpt-4o",
     additional_context: str = "",
+    session: Optional[Session] = None,
+    batch: bool = False,
 ) -> Optional[dict]:
     """Identify a single improvement task from codebase analysis.
 
     Returns dict with keys: task_type, description, target_files, evidence
-    or None on failure.
+    or None on failure. With batch=True the request goes through the
+    Batch API (half price, separate rate-limit pool) and this call
+    blocks while polling -- only for background loops where turnaround
+    does not matter.
     """
-    user_content = (
-        f"## Codebase Summary\n{summary}\n\n"
-        f"## Test Results\n{test_results}\n\n"
-        f"## Improvement History\n{history}"
-    )
-    if additional_context:
-        user_content += f"\n\n## External Context\n{additional_context}"
+    try:
+        messages = _with_session(
+            session, _analyze_messages(summary, test_results, history, additional_context)
+        )
+        payload = {"model": model, "messages": messages, "max_tokens": 800}
+        result = llm_cache.get(payload)
+        if result is not None:
+            return result
+        content = None
+        if batch:
+            content = _run_via_batch(
+                client,
+                {
+                    "model": model,
+                    "messages": messages,
+                    "max_tokens": 800,
+                    "response_format": {"type": "json_object"},
+                },
+            )
+        if content is None:
+            content = _stream_tool_args(
+                client,
+                model=model,
+                max_tokens=800,
+                **_tool_kwargs("emit_task", _TASK_SCHEMA),
+                messages=messages,
+            )
+        result = _loads(content)
+        llm_cache.put(payload, result)
+        return result
+    except Exception:
+        log.exception("analyze_codebase failed")
+        return None
+
 
+async def analyze_codebase_async(
+    client: AsyncOpenAI,
+    summary: str,
+    test_results: str,
+    history: str,
+    model: str = "gpt-4o",
+    additional_context: str = "",
+    session: Optional[Session] = None,
+) -> Optional[dict]:
+    """Async variant of analyze_codebase, for gather-style fan-out."""
     try:
-        resp = client.chat.completions.create(
+        messages = _with_session(
+            session, _analyze_messages(summary, test_results, history, additional_context)
+        )
+        payload = {"model": model, "messages": messages, "max_tokens": 800}
+        result = llm_cache.get(payload)
+        if result is not None:
+            return result
+        await _throttle(model, messages, 800)
+        resp = await _acreate_with_retry(
+            client,
             model=model,
             max_tokens=800,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a code quality analyst. You identify ONE concrete, "
-                        "small improvement to make to a Python codebase. Focus on:\n"
-                        "1. Fixing failing tests (fix_test)\n"
-                        "2. Adding missing test coverage (add_test)\n"
-                        "3. Fixing clear bugs (fix_bug)\n\n"
-                        "You may receive External Context from community posts. "
-                        "Use it to prioritize improvements aligned with community interest.\n\n"
-                        "Output JSON with keys:\n"
-                        "- task_type: one of 'fix_test', 'add_test', 'fix_bug'\n"
-                        "- description: what to fix/add (1-2 sentences)\n"
-                        "- target_files: list of file paths to modify\n"
-                        "- evidence: why this improvement is needed\n"
-                        "- priority: 'high', 'medium', or 'low'\n\n"
-                        "If no improvements are needed, return {\"task_type\": \"none\", \"description\": \"No improvements needed\"}.\n"
-                        "IMPORTANT: Never suggest modifying config.py, improvement.py, git_ops.py, evaluation.py, or policies.py."
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": user_content,
-                },
-            ],
+            **_tool_kwargs("emit_task", _TASK_SCHEMA),
+            messages=messages,
         )
-        content = resp.choices[0].message.content
-        return json.loads(content)
+        result = _loads(_tool_args(resp))
+        llm_cache.put(payload, result)
+        return result
     except Exception:
-        log.exception("analyze_codebase failed")
+        log.exception("analyze_codebase_async failed")
         return None
 
 
+def _plan_messages(task: dict, code: str) -> list:
+    """Messages for a planning request; shared by the sync and async paths."""
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a senior Python developer planning a code change. "
+                "Create a clear, step-by-step plan for the improvement. "
+                "Be specific about what to change and where. "
+                "Keep the plan concise (under 10 steps)."
+            ),
+        },
+        # Static-first ordering: the code block repeats across
+        # iterations on the same task, so leading with it lets
+        # OpenAI's prefix cache discount those input tokens.
+        {
+            "role": "user",
+            "content": (
+                f"## Relevant Code\n{code}\n\n"
+                f"## Task\nType: {task.get('task_type')}\n"
+                f"Description: {task.get('description')}\n"
+                f"Target files: {task.get('target_files')}\n"
+                f"Evidence: {task.get('evidence')}"
+            ),
+        },
+    ]
+
+
 def plan_code_change(
     client: OpenAI,
     task: dict,
@@ -220,45 +1423,235 @@ def plan_code_change(
     """Generate a step-by-step plan for implementing a code change.
 
     Returns the plan as a string, or None on failure.
+
+    Identical (task, code) pairs -- common while iterating on one task
+    during development -- replay from the exact-match cache.
     """
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            max_tokens=600,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a senior Python developer planning a code change. "
-                        "Create a clear, step-by-step plan for the improvement. "
-                        "Be specific about what to change and where. "
-                        "Keep the plan concise (under 10 steps)."
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"## Task\nType: {task.get('task_type')}\n"
-                        f"Description: {task.get('description')}\n"
-                        f"Target files: {task.get('target_files')}\n"
-                        f"Evidence: {task.get('evidence')}\n\n"
-                        f"## Relevant Code\n{code}"
-                    ),
-                },
-            ],
-        )
-        return resp.choices[0].message.content
+        messages = _plan_messages(task, code)
+        payload = {"model": model, "messages": messages, "max_tokens": 600}
+        text = llm_cache.get(payload)
+        if text is None:
+            resp = _create_with_retry(
+                client,
+                model=model,
+                max_tokens=600,
+                messages=messages,
+            )
+            text = resp.choices[0].message.content
+            if text:
+                llm_cache.put(payload, text)
+        return text
     except Exception:
         log.exception("plan_code_change failed")
         return None
 
 
+async def plan_code_change_async(
+    client: AsyncOpenAI,
+    task: dict,
+    code: str,
+    model: str = "gpt-4o",
+) -> Optional[str]:
+    """Async variant of plan_code_change, for gather-style fan-out."""
+    try:
+        messages = _plan_messages(task, code)
+        payload = {"model": model, "messages": messages, "max_tokens": 600}
+        text = llm_cache.get(payload)
+        if text is None:
+            await _throttle(model, messages, 600)
+            resp = await _acreate_with_retry(
+                client,
+                model=model,
+                max_tokens=600,
+                messages=messages,
+            )
+            text = resp.choices[0].message.content
+            if text:
+                llm_cache.put(payload, text)
+        return text
+    except Exception:
+        log.exception("plan_code_change_async failed")
+        return None
+
+
+# The code-context builders used to re-join every file into a fresh
+# pack on each call and ship all of it regardless of size. build_file_pack
+# formats each file block once per content version, trims greedily to a
+# token budget, and stamps the pack with a version hash so calls that
+# change no file send a byte-identical (and provider-cacheable) prefix.
+_FILE_PACK_BUDGET_TOKENS = 24_000
+_PER_FILE_CAP_TOKENS = 6_000
+_FILE_BLOCK_CACHE_MAX = 256
+_file_block_cache: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+
+def _truncate_middle(content: str, cap_tokens: int = _PER_FILE_CAP_TOKENS) -> str:
+    """Cut the middle out of an oversized file, keeping head and tail.
+
+    Imports and early definitions live at the top, the most recently
+    grown code at the bottom; the middle is the cheapest part to drop.
+    Uses the same ~4 chars/token estimate as the pack budget.
+    """
+    max_chars = cap_tokens * 4
+    if len(content) <= max_chars:
+        return content
+    keep = max_chars // 2
+    omitted = (len(content) - 2 * keep) // 4
+    return (
+        content[:keep]
+        + f"\n# ... [truncated ~{omitted} tokens] ...\n"
+        + content[-keep:]
+    )
+
+
+def build_file_pack(
+    files: dict, budget_tokens: int = _FILE_PACK_BUDGET_TOKENS
+) -> Tuple[str, str]:
+    """Deterministic, budget-trimmed pack of ### path code blocks.
+
+    Returns (packed_str, version_hash). Files are packed in sorted order
+    until the estimated token budget is spent; at least one file always
+    goes in. The leading version marker makes it obvious downstream
+    which pack a prompt was built from.
+    """
+    parts = []
+    used = 0
+    for path, content in sorted(files.items()):
+        key = (path, hash(content))
+        # pop + reinsert keeps dict order as recency order, so the
+        # eviction below always drops the least recently used block.
+        entry = _file_block_cache.pop(key, None)
+        if entry is None:
+            block = "".join(
+                ("### ", path, "\n```python\n", _truncate_middle(content), "\n```")
+            )
+            entry = (block, len(block) // 4)
+        _file_block_cache[key] = entry
+        if len(_file_block_cache) > _FILE_BLOCK_CACHE_MAX:
+            _file_block_cache.pop(next(iter(_file_block_cache)))
+        block, cost = entry
+        if parts and used + cost > budget_tokens:
+            log.debug("File pack budget reached; omitting %s and later files", path)
+            break
+        parts.append(block)
+        used += cost
+    packed = "\n\n".join(parts)
+    version = hashlib.blake2b(packed.encode("utf-8"), digest_size=8).hexdigest()
+    return f"<!-- pack v={version} -->\n{packed}", version
+
+
+# Model-tier routing for code generation: full-model outputs populate a
+# semantic exemplar cache keyed on the plan embedding; a later similar
+# plan replays the exemplar in-context and lets gpt-4o-mini recompose
+# the answer at ~10x lower token cost, with the mini output validated
+# and escalated back to the full model when it doesn't hold up.
+_CODE_MINI_MODEL = "gpt-4o-mini"
+_code_sem_cache = semantic_cache.SemanticCache(threshold=0.8)
+
+# mini vs full call counts, for watching the realized cost ratio.
+code_tier_counts = {"mini": 0, "full": 0}
+
+
+def _valid_changes(changes) -> bool:
+    return isinstance(changes, list) and all(
+        isinstance(c, dict) and c.get("file_path") and "new_content" in c
+        for c in changes
+    )
+
+
+def _code_changes_attempt(client: OpenAI, model: str, messages: list) -> Optional[list]:
+    """One generation attempt; returns validated changes or None."""
+    content = _stream_tool_args(
+        client,
+        model=model,
+        max_tokens=2000,
+        **_tool_kwargs("emit_changes", _CODE_CHANGES_SCHEMA),
+        messages=messages,
+    )
+    # A malformed or truncated blob is this attempt failing, not the
+    # whole call: return None so the caller can escalate to the next
+    # tier instead of bailing out through its outer except.
+    try:
+        changes = _loads(content).get("changes", [])
+    except (ValueError, TypeError, AttributeError):
+        log.warning("Unparseable changes JSON from %s", model)
+        return None
+    return changes if _valid_changes(changes) else None
+
+
+async def _acode_changes_attempt(
+    client: AsyncOpenAI, model: str, messages: list
+) -> Optional[list]:
+    """Async twin of _code_changes_attempt (non-streaming)."""
+    await _throttle(model, messages, 2000)
+    resp = await _acreate_with_retry(
+        client,
+        model=model,
+        max_tokens=2000,
+        **_tool_kwargs("emit_changes", _CODE_CHANGES_SCHEMA),
+        messages=messages,
+    )
+    try:
+        changes = _loads(_tool_args(resp)).get("changes", [])
+    except (ValueError, TypeError, AttributeError):
+        log.warning("Unparseable changes JSON from %s", model)
+        return None
+    return changes if _valid_changes(changes) else None
+
+
+# Invariant for the two constraint-bearing system prompts below: all
+# per-call content (files, plan, suggestion) lives in the user message,
+# never here. Constraints change rarely, so the memoized system string
+# stays byte-identical across calls -- which is what the provider's
+# automatic prefix cache keys on.
+@functools.lru_cache(maxsize=32)
+def _code_system_content(constraints: str) -> str:
+    return (
+        "You are a Python code generator. Given a plan and existing code, "
+        "produce the complete new file contents for each file that needs changing.\n\n"
+        "Output JSON with key 'changes', a list of objects:\n"
+        "- file_path: relative path of the file\n"
+        "- new_content: the COMPLETE new file content (not a diff)\n"
+        "- description: what was changed and why (1 sentence)\n\n"
+        "IMPORTANT:\n"
+        "- Output complete file contents, not patches\n"
+        "- Preserve existing functionality\n"
+        "- Follow existing code style\n"
+        "- Do not add unnecessary imports or code\n"
+        f"\nConstraints:\n{constraints}"
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _sug_impl_system_content(constraints: str) -> str:
+    return _SUG_IMPL_PROMPT + f"\n\nConstraints:\n{constraints}"
+
+
+def _code_system_msg(constraints: str) -> dict:
+    return {"role": "system", "content": _code_system_content(constraints)}
+
+
+def _code_user_msg(file_contents: str, plan: str) -> dict:
+    # Files first (static across retries), plan last (changes every
+    # iteration) for the prefix cache.
+    return {
+        "role": "user",
+        "content": (
+            f"## Current File Contents\n{file_contents}\n\n"
+            f"## Plan\n{plan}"
+        ),
+    }
+
+
 def generate_code(
     client: OpenAI,
     plan: str,
     files: dict,
     constraints: str,
     model: str = "gpt-4o",
+    session: Optional[Session] = None,
+    batch: bool = False,
 ) -> Optional[list]:
     """Generate code changes based on a plan.
 
@@ -266,55 +1659,148 @@ def generate_code(
         plan: The improvement plan.
         files: Dict mapping file paths to their current contents.
         constraints: Safety constraints to follow.
+        batch: Route through the half-price Batch API; blocks while
+            polling, so only for non-interactive agent loops.
 
     Returns list of dicts with keys: file_path, new_content, description.
     Returns None on failure.
     """
-    file_contents = "\n\n".join(
-        f"### {path}\n```python\n{content}\n```"
-        for path, content in files.items()
-    )
+    file_contents, _ = build_file_pack(files)
+    system_msg = _code_system_msg(constraints)
+    user_msg = _code_user_msg(file_contents, plan)
 
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            max_tokens=2000,
-            response_format={"type": "json_object"},
-            messages=[
+        if batch:
+            content = _run_via_batch(
+                client,
                 {
-                    "role": "system",
-                    "content": (
-                        "You are a Python code generator. Given a plan and existing code, "
-                        "produce the complete new file contents for each file that needs changing.\n\n"
-                        "Output JSON with key 'changes', a list of objects:\n"
-                        "- file_path: relative path of the file\n"
-                        "- new_content: the COMPLETE new file content (not a diff)\n"
-                        "- description: what was changed and why (1 sentence)\n\n"
-                        "IMPORTANT:\n"
-                        "- Output complete file contents, not patches\n"
-                        "- Preserve existing functionality\n"
-                        "- Follow existing code style\n"
-                        "- Do not add unnecessary imports or code\n"
-                        f"\nConstraints:\n{constraints}"
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"## Plan\n{plan}\n\n"
-                        f"## Current File Contents\n{file_contents}"
-                    ),
+                    "model": model,
+                    "messages": _with_session(session, [system_msg, user_msg]),
+                    "max_tokens": 2000,
+                    "response_format": {"type": "json_object"},
                 },
-            ],
+            )
+            if content is not None:
+                changes = _loads(content).get("changes", [])
+                if _valid_changes(changes):
+                    code_tier_counts["full"] += 1
+                    return changes
+            log.info("Batch code generation failed; falling back to interactive call")
+        vec = semantic_cache.embed(plan)
+        exemplar = _code_sem_cache.get(vec)
+        if exemplar is not None:
+            changes = _code_changes_attempt(
+                client,
+                _CODE_MINI_MODEL,
+                _with_session(session, [
+                    system_msg,
+                    {
+                        "role": "user",
+                        "content": "A previous task had a very similar plan.",
+                    },
+                    {
+                        "role": "assistant",
+                        "content": _dumps({"changes": exemplar}),
+                    },
+                    user_msg,
+                ]),
+            )
+            if changes is not None:
+                code_tier_counts["mini"] += 1
+                return changes
+            log.info("Mini-tier recomposition failed validation; using %s", model)
+        changes = _code_changes_attempt(
+            client, model, _with_session(session, [system_msg, user_msg])
         )
-        content = resp.choices[0].message.content
-        result = json.loads(content)
-        return result.get("changes", [])
+        if changes is not None:
+            code_tier_counts["full"] += 1
+            _code_sem_cache.put(vec, changes)
+        return changes
     except Exception:
         log.exception("generate_code failed")
         return None
 
 
+async def generate_code_async(
+    client: AsyncOpenAI,
+    plan: str,
+    files: dict,
+    constraints: str,
+    model: str = "gpt-4o",
+    session: Optional[Session] = None,
+) -> Optional[list]:
+    """Async variant of generate_code, for gather-style fan-out.
+
+    Same tier routing and exemplar cache as the sync path; the request
+    itself is non-streaming, since the caller is already overlapping
+    work via the event loop.
+    """
+    file_contents, _ = build_file_pack(files)
+    system_msg = _code_system_msg(constraints)
+    user_msg = _code_user_msg(file_contents, plan)
+
+    try:
+        vec = semantic_cache.embed(plan)
+        exemplar = _code_sem_cache.get(vec)
+        if exemplar is not None:
+            changes = await _acode_changes_attempt(
+                client,
+                _CODE_MINI_MODEL,
+                _with_session(session, [
+                    system_msg,
+                    {
+                        "role": "user",
+                        "content": "A previous task had a very similar plan.",
+                    },
+                    {
+                        "role": "assistant",
+                        "content": _dumps({"changes": exemplar}),
+                    },
+                    user_msg,
+                ]),
+            )
+            if changes is not None:
+                code_tier_counts["mini"] += 1
+                return changes
+            log.info("Mini-tier recomposition failed validation; using %s", model)
+        changes = await _acode_changes_attempt(
+            client, model, _with_session(session, [system_msg, user_msg])
+        )
+        if changes is not None:
+            code_tier_counts["full"] += 1
+            _code_sem_cache.put(vec, changes)
+        return changes
+    except Exception:
+        log.exception("generate_code_async failed")
+        return None
+
+
+def _question_post_messages(
+    task_data: dict, code_context: dict, test_failures: str
+) -> list:
+    """Messages for a question post; shared by the sync and async paths."""
+    code_block, _ = build_file_pack(code_context)
+    return [
+        {
+            "role": "system",
+            "content": _QUESTION_POST_PROMPT,
+        },
+        # Code context first: it is stable across retries on the
+        # same task, so the prefix cache covers the bulk of it.
+        {
+            "role": "user",
+            "content": (
+                f"## Code Context\n{code_block}\n\n"
+                f"## Test Output\n{test_failures}\n\n"
+                f"## Task\nType: {task_data.get('task_type')}\n"
+                f"Description: {task_data.get('description')}\n"
+                f"Target files: {task_data.get('target_files')}\n"
+                f"Evidence: {task_data.get('evidence')}"
+            ),
+        },
+    ]
+
+
 def generate_question_post(
     client: OpenAI,
     task_data: dict,
@@ -331,41 +1817,114 @@ def generate_question_post(
 
     Returns dict with 'title' and 'content' keys, or None on failure.
     """
-    code_block = "\n\n".join(
-        f"### {path}\n```python\n{content}\n```"
-        for path, content in code_context.items()
-    )
-
     try:
-        resp = client.chat.completions.create(
+        resp = _create_with_retry(
+            client,
             model=model,
             max_tokens=600,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_question_post_prompt(),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"## Task\nType: {task_data.get('task_type')}\n"
-                        f"Description: {task_data.get('description')}\n"
-                        f"Target files: {task_data.get('target_files')}\n"
-                        f"Evidence: {task_data.get('evidence')}\n\n"
-                        f"## Code Context\n{code_block}\n\n"
-                        f"## Test Output\n{test_failures}"
-                    ),
-                },
-            ],
+            **_tool_kwargs("emit_post", _POST_SCHEMA),
+            messages=_question_post_messages(task_data, code_context, test_failures),
         )
-        content = resp.choices[0].message.content
-        return json.loads(content)
+        return _loads(_tool_args(resp))
     except Exception:
         log.exception("generate_question_post failed")
         return None
 
 
+async def generate_question_post_async(
+    client: AsyncOpenAI,
+    task_data: dict,
+    code_context: dict,
+    test_failures: str,
+    model: str = "gpt-4o",
+) -> Optional[dict]:
+    """Async variant of generate_question_post, for gather-style fan-out."""
+    try:
+        messages = _question_post_messages(task_data, code_context, test_failures)
+        await _throttle(model, messages, 600)
+        resp = await _acreate_with_retry(
+            client,
+            model=model,
+            max_tokens=600,
+            **_tool_kwargs("emit_post", _POST_SCHEMA),
+            messages=messages,
+        )
+        return _loads(_tool_args(resp))
+    except Exception:
+        log.exception("generate_question_post_async failed")
+        return None
+
+
+# Call-graph independence: for one task, the implementation plan and the
+# community question post derive from the same inputs but not from each
+# other (analyze -> plan -> generate stays sequential; plan and question
+# post fork). fanout_task runs that independent pair concurrently.
+async def fanout_task(
+    client: AsyncOpenAI,
+    task: dict,
+    code: str,
+    code_context: dict,
+    test_failures: str,
+    model: str = "gpt-4o",
+) -> Tuple[Optional[str], Optional[dict]]:
+    """Run plan_code_change and generate_question_post concurrently.
+
+    Returns (plan, question_post); either element is None on failure,
+    matching the individual functions.
+    """
+    plan, post = await asyncio.gather(
+        plan_code_change_async(client, task, code, model=model),
+        generate_question_post_async(
+            client, task, code_context, test_failures, model=model
+        ),
+    )
+    return plan, post
+
+
+def _fmt_comments(comments: list, with_ids: bool = False) -> str:
+    """Format a comment thread for a prompt in one buffered pass.
+
+    Empty comments are skipped entirely -- each one used to cost ~20
+    prompt tokens of author boilerplate around no content. Written into
+    a single StringIO rather than a join over per-comment f-strings.
+    """
+    buf = io.StringIO()
+    for c in comments:
+        content = (c.get("content") or "").strip()
+        if not content:
+            continue
+        author = (c.get("author") or {}).get("name") or "unknown"
+        if with_ids:
+            buf.write(f"@{author} (id: {c.get('id', 'unknown')}): {content}\n\n")
+        else:
+            buf.write(f"@{author}: {content}\n\n")
+    return buf.getvalue()
+
+
+def _suggestion_messages(problem: str, code_context: dict, comments: list) -> list:
+    """Messages for suggestion mining; shared by the sync and async paths."""
+    code_block, _ = build_file_pack(code_context)
+    comments_text = _fmt_comments(comments, with_ids=True)
+    return [
+        {
+            "role": "system",
+            "content": _CODE_SUG_PROMPT,
+        },
+        # Code first, problem next, comments last: each poll of
+        # the same post repeats the first two verbatim and only
+        # grows the comment tail, which is what the prefix cache
+        # wants.
+        {
+            "role": "user",
+            "content": (
+                f"## Code Context\n{code_block}\n\n"
+                f"## Problem\n{problem}\n\n"
+                f"## Comments\n{comments_text}"
+            ),
+        },
+    ]
+
+
 def analyze_code_suggestions(
     client: OpenAI,
     problem: str,
@@ -377,44 +1936,80 @@ def analyze_code_suggestions(
 
     Returns dict with 'suggestions' list and 'has_actionable' bool, or None.
     """
-    code_block = "\n\n".join(
-        f"### {path}\n```python\n{content}\n```"
-        for path, content in code_context.items()
-    )
+    try:
+        messages = _suggestion_messages(problem, code_context, comments)
+        resp = _create_with_retry(
+            client,
+            model=model,
+            max_tokens=800,
+            **_tool_kwargs("emit_suggestions", _SUGGESTIONS_SCHEMA),
+            messages=messages,
+        )
+        return _loads(_tool_args(resp))
+    except Exception:
+        log.exception("analyze_code_suggestions failed")
+        return None
 
-    comments_text = "\n\n".join(
-        f"Comment by {c.get('author', {}).get('name', 'unknown')} "
-        f"(id: {c.get('id', 'unknown')}): {c.get('content', '')}"
-        for c in comments
-    )
 
+async def analyze_code_suggestions_async(
+    client: AsyncOpenAI,
+    problem: str,
+    code_context: dict,
+    comments: list,
+    model: str = "gpt-4o",
+) -> Optional[dict]:
+    """Async variant of analyze_code_suggestions, for gather-style fan-out."""
     try:
-        resp = client.chat.completions.create(
+        messages = _suggestion_messages(problem, code_context, comments)
+        await _throttle(model, messages, 800)
+        resp = await _acreate_with_retry(
+            client,
             model=model,
             max_tokens=800,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_code_suggestion_prompt(),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"## Problem\n{problem}\n\n"
-                        f"## Code Context\n{code_block}\n\n"
-                        f"## Comments\n{comments_text}"
-                    ),
-                },
-            ],
+            **_tool_kwargs("emit_suggestions", _SUGGESTIONS_SCHEMA),
+            messages=messages,
         )
-        content = resp.choices[0].message.content
-        return json.loads(content)
+        return _loads(_tool_args(resp))
     except Exception:
-        log.exception("analyze_code_suggestions failed")
+        log.exception("analyze_code_suggestions_async failed")
         return None
 
 
+def _suggestion_impl_messages(
+    suggestion: dict, code_context: dict, plan: str, constraints: str
+) -> list:
+    """Messages for suggestion-guided codegen; shared sync and async."""
+    file_contents, _ = build_file_pack(code_context)
+
+    suggestion_text = (
+        f"Commenter: {suggestion.get('author', 'unknown')}\n"
+        f"Approach: {suggestion.get('approach', '')}\n"
+    )
+    snippets = suggestion.get("code_snippets", [])
+    if snippets:
+        suggestion_text += "Code snippets from commenter:\n"
+        for snippet in snippets:
+            suggestion_text += f"```\n{snippet}\n```\n"
+
+    return [
+        {
+            "role": "system",
+            "content": _sug_impl_system_content(constraints),
+        },
+        # Same static-first inversion as generate_code: file
+        # contents lead, the per-iteration plan and suggestion
+        # trail.
+        {
+            "role": "user",
+            "content": (
+                f"## Current File Contents\n{file_contents}\n\n"
+                f"## Plan\n{plan}\n\n"
+                f"## Community Suggestion\n{suggestion_text}"
+            ),
+        },
+    ]
+
+
 def generate_code_from_suggestion(
     client: OpenAI,
     suggestion: dict,
@@ -422,6 +2017,7 @@ def generate_code_from_suggestion(
     plan: str,
     constraints: str,
     model: str = "gpt-4o",
+    session: Optional[Session] = None,
 ) -> Optional[list]:
     """Generate code changes guided by a community suggestion.
 
@@ -433,52 +2029,75 @@ def generate_code_from_suggestion(
 
     Returns list of dicts with file_path, new_content, description. None on failure.
     """
-    file_contents = "\n\n".join(
-        f"### {path}\n```python\n{content}\n```"
-        for path, content in code_context.items()
-    )
+    try:
+        messages = _with_session(
+            session, _suggestion_impl_messages(suggestion, code_context, plan, constraints)
+        )
+        resp = _create_with_retry(
+            client,
+            model=model,
+            max_tokens=2000,
+            **_tool_kwargs("emit_changes", _CODE_CHANGES_SCHEMA),
+            messages=messages,
+        )
+        result = _loads(_tool_args(resp))
+        return result.get("changes", [])
+    except Exception:
+        log.exception("generate_code_from_suggestion failed")
+        return None
 
-    suggestion_text = (
-        f"Commenter: {suggestion.get('author', 'unknown')}\n"
-        f"Approach: {suggestion.get('approach', '')}\n"
-    )
-    snippets = suggestion.get("code_snippets", [])
-    if snippets:
-        suggestion_text += "Code snippets from commenter:\n"
-        for s in snippets:
-            suggestion_text += f"```\n{s}\n```\n"
 
+async def generate_code_from_suggestion_async(
+    client: AsyncOpenAI,
+    suggestion: dict,
+    code_context: dict,
+    plan: str,
+    constraints: str,
+    model: str = "gpt-4o",
+    session: Optional[Session] = None,
+) -> Optional[list]:
+    """Async variant of generate_code_from_suggestion."""
     try:
-        resp = client.chat.completions.create(
+        messages = _with_session(
+            session, _suggestion_impl_messages(suggestion, code_context, plan, constraints)
+        )
+        await _throttle(model, messages, 2000)
+        resp = await _acreate_with_retry(
+            client,
             model=model,
             max_tokens=2000,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        prompts.load_suggestion_implementation_prompt()
-                        + f"\n\nConstraints:\n{constraints}"
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"## Community Suggestion\n{suggestion_text}\n\n"
-                        f"## Plan\n{plan}\n\n"
-                        f"## Current File Contents\n{file_contents}"
-                    ),
-                },
-            ],
+            **_tool_kwargs("emit_changes", _CODE_CHANGES_SCHEMA),
+            messages=messages,
         )
-        content = resp.choices[0].message.content
-        result = json.loads(content)
+        result = _loads(_tool_args(resp))
         return result.get("changes", [])
     except Exception:
-        log.exception("generate_code_from_suggestion failed")
+        log.exception("generate_code_from_suggestion_async failed")
         return None
 
 
+def _upgrade_messages(post_title: str, post_content: str, comments: list) -> list:
+    """Messages for upgrade mining; shared by the sync and async paths."""
+    comments_text = _fmt_comments(comments)
+    return [
+        {
+            "role": "system",
+            "content": _COMMENT_ANALYSIS_PROMPT,
+        },
+        {
+            "role": "user",
+            "content": f"""Post Title: {post_title}
+
+Post Content: {post_content}
+
+Comments received:
+{comments_text}
+
+Analyze these comments for actionable improvements to the agent's configuration or behavior.""",
+        },
+    ]
+
+
 def analyze_comments_for_upgrades(
     client: OpenAI,
     post_title: str,
@@ -494,37 +2113,41 @@ def analyze_comments_for_upgrades(
     Returns None on failure.
     """
     try:
-        comments_text = "\n\n".join([
-            f"Comment by {c.get('author', {}).get('name', 'unknown')}: {c.get('content', '')}"
-            for c in comments
-        ])
-
-        resp = client.chat.completions.create(
+        messages = _upgrade_messages(post_title, post_content, comments)
+        resp = _create_with_retry(
+            client,
             model=model,
             max_tokens=600,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_comment_analysis_prompt(),
-                },
-                {
-                    "role": "user",
-                    "content": f"""Post Title: {post_title}
-
-Post Content: {post_content}
+            **_tool_kwargs("emit_upgrades", _UPGRADES_SCHEMA, strict=False),
+            messages=messages,
+        )
+        return _loads(_tool_args(resp))
+    except Exception:
+        log.exception("analyze_comments_for_upgrades failed")
+        return None
 
-Comments received:
-{comments_text}
 
-Analyze these comments for actionable improvements to the agent's configuration or behavior.""",
-                },
-            ],
+async def analyze_comments_for_upgrades_async(
+    client: AsyncOpenAI,
+    post_title: str,
+    post_content: str,
+    comments: list,
+    model: str = "gpt-4o-mini",
+) -> Optional[dict]:
+    """Async variant of analyze_comments_for_upgrades."""
+    try:
+        messages = _upgrade_messages(post_title, post_content, comments)
+        await _throttle(model, messages, 600)
+        resp = await _acreate_with_retry(
+            client,
+            model=model,
+            max_tokens=600,
+            **_tool_kwargs("emit_upgrades", _UPGRADES_SCHEMA, strict=False),
+            messages=messages,
         )
-        content = resp.choices[0].message.content
-        return json.loads(content)
+        return _loads(_tool_args(resp))
     except Exception:
-        log.exception("analyze_comments_for_upgrades failed")
+        log.exception("analyze_comments_for_upgrades_async failed")
         return None
 
 
@@ -540,25 +2163,32 @@ def mine_insight_for_codebase(
     Returns a 1-2 sentence task description, or None if nothing applicable.
     """
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            max_tokens=150,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_comment_mining_prompt(),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"Post title: {post_title}\n\n"
-                        f"Post content: {post_content}\n\n"
-                        f"Your comment: {bot_comment}"
-                    ),
-                },
-            ],
-        )
-        text = resp.choices[0].message.content
+        messages = [
+            {
+                "role": "system",
+                "content": _COMMENT_MINING_PROMPT,
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"Post title: {post_title}\n\n"
+                    f"Post content: {post_content}\n\n"
+                    f"Your comment: {bot_comment}"
+                ),
+            },
+        ]
+        payload = {"model": model, "messages": messages, "max_tokens": 150}
+        text = llm_cache.get(payload)
+        if text is None:
+            resp = _create_with_retry(
+                client,
+                model=model,
+                max_tokens=150,
+                messages=messages,
+            )
+            text = resp.choices[0].message.content
+            if text:
+                llm_cache.put(payload, text)
         if text and text.strip().upper() == "NONE":
             return None
         return text
@@ -579,34 +2209,96 @@ def extract_topic_signal(
     Returns a one-sentence topic signal, or None on failure.
     """
     try:
-        replies_text = "\n".join(
-            f"- {r}" if isinstance(r, str) else f"- {r.get('content', '')}"
-            for r in replies
-        )
-        resp = client.chat.completions.create(
-            model=model,
-            max_tokens=80,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_topic_signal_prompt(),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"Post title: {post_title}\n\n"
-                        f"Bot's comment: {bot_comment}\n\n"
-                        f"Replies:\n{replies_text}"
-                    ),
-                },
-            ],
-        )
-        return resp.choices[0].message.content
+        buf = io.StringIO()
+        for r in replies:
+            content = r if isinstance(r, str) else (r.get("content") or "")
+            if content.strip():
+                buf.write(f"- {content}\n")
+        replies_text = buf.getvalue()
+        messages = [
+            {
+                "role": "system",
+                "content": _TOPIC_SIGNAL_PROMPT,
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"Post title: {post_title}\n\n"
+                    f"Bot's comment: {bot_comment}\n\n"
+                    f"Replies:\n{replies_text}"
+                ),
+            },
+        ]
+        payload = {"model": model, "messages": messages, "max_tokens": 80}
+        text = llm_cache.get(payload)
+        if text is None:
+            resp = _create_with_retry(
+                client,
+                model=model,
+                max_tokens=80,
+                messages=messages,
+            )
+            text = resp.choices[0].message.content
+            if text:
+                llm_cache.put(payload, text)
+        return text
     except Exception:
         log.exception("extract_topic_signal failed")
         return None
 
 
+# Insight extraction packs as many posts per request as fit a token
+# budget: the system prompt and per-request overhead amortize across
+# posts, and this flow is RPM-bound rather than TPM-bound, so fewer
+# bigger requests are a straight throughput win.
+_INSIGHT_MAX_POSTS = 40
+_INSIGHT_CHAR_BUDGET = 100_000  # ~25k tokens, well under context minus output
+_INSIGHT_TOKENS_PER_POST = 150  # output budget per packed post
+
+
+def _pack_insight_posts(posts: list) -> Tuple[str, int]:
+    """Format numbered post blocks up to the count and char budget.
+
+    Returns (posts_text, n_packed); the [Post i] index prefix is what
+    lets the JSON result map back to its source post.
+    """
+    parts = []
+    total = 0
+    for i, p in enumerate(posts[:_INSIGHT_MAX_POSTS]):
+        block = f"[Post {i}] Title: {p.get('title', '')}\nContent: {p.get('content', '')}"
+        if parts and total + len(block) > _INSIGHT_CHAR_BUDGET:
+            break
+        parts.append(block)
+        total += len(block)
+    return "\n\n".join(parts), len(parts)
+
+
+def _insight_messages(posts_text: str) -> list:
+    return [
+        {
+            "role": "system",
+            "content": _INSIGHT_PROMPT,
+        },
+        {
+            "role": "user",
+            "content": posts_text,
+        },
+    ]
+
+
+def _validate_insights(result, n_posts: int) -> list:
+    """Keep only well-formed entries whose post_index maps to a real post."""
+    if not isinstance(result, list):
+        result = result.get("insights", []) if isinstance(result, dict) else []
+    return [
+        r
+        for r in result
+        if isinstance(r, dict)
+        and isinstance(r.get("post_index"), int)
+        and 0 <= r["post_index"] < n_posts
+    ]
+
+
 def extract_insights_batch(
     client: OpenAI,
     posts: list,
@@ -614,40 +2306,125 @@ def extract_insights_batch(
 ) -> Optional[list]:
     """Batch-extract technical insights from posts for the knowledge base.
 
-    Takes up to 5 posts. Returns list of dicts with post_index, insight, tags.
-    Returns None on failure.
+    Packs as many posts as fit the token budget into one request.
+    Returns list of dicts with post_index, insight, tags, or None on
+    failure. Entries with an out-of-range or missing post_index are
+    dropped.
     """
-    posts_text = "\n\n".join(
-        f"[Post {i}] Title: {p.get('title', '')}\nContent: {p.get('content', '')}"
-        for i, p in enumerate(posts[:5])
-    )
+    posts_text, n_packed = _pack_insight_posts(posts)
+    # The output cap must scale with the pack: a full pack cannot emit
+    # one insight object per post inside a fixed 300-token budget, and a
+    # truncated tool-call blob fails the whole batch at parse time.
+    max_tokens = _INSIGHT_TOKENS_PER_POST * max(n_packed, 1)
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            max_tokens=300,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_insight_extraction_prompt(),
-                },
+        messages = _insight_messages(posts_text)
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "response_format": "json_object",
+        }
+        cached = llm_cache.get(payload)
+        if cached is not None:
+            return cached
+        content = None
+        if _batch_enabled():
+            content = _run_via_batch(
+                client,
                 {
-                    "role": "user",
-                    "content": posts_text,
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "response_format": {"type": "json_object"},
+                    "messages": messages,
                 },
-            ],
-        )
-        content = resp.choices[0].message.content
-        result = json.loads(content)
-        # Handle both {"insights": [...]} and raw [...]
-        if isinstance(result, list):
-            return result
-        return result.get("insights", [])
+            )
+        if content is None:
+            resp = _create_with_retry(
+                client,
+                model=model,
+                max_tokens=max_tokens,
+                **_tool_kwargs("emit_insights", _INSIGHTS_SCHEMA),
+                messages=messages,
+            )
+            content = _tool_args(resp)
+        result = _validate_insights(_loads(content), n_packed)
+        llm_cache.put(payload, result)
+        return result
     except Exception:
         log.exception("extract_insights_batch failed")
         return None
 
 
+async def extract_insights_batch_async(
+    client: AsyncOpenAI,
+    posts: list,
+    model: str = "gpt-4o-mini",
+) -> Optional[list]:
+    """Async variant of extract_insights_batch, for gather-style fan-out."""
+    posts_text, n_packed = _pack_insight_posts(posts)
+    max_tokens = _INSIGHT_TOKENS_PER_POST * max(n_packed, 1)
+    try:
+        messages = _insight_messages(posts_text)
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "response_format": "json_object",
+        }
+        cached = llm_cache.get(payload)
+        if cached is not None:
+            return cached
+        await _throttle(model, messages, max_tokens)
+        resp = await _acreate_with_retry(
+            client,
+            model=model,
+            max_tokens=max_tokens,
+            **_tool_kwargs("emit_insights", _INSIGHTS_SCHEMA),
+            messages=messages,
+        )
+        result = _validate_insights(_loads(_tool_args(resp)), n_packed)
+        llm_cache.put(payload, result)
+        return result
+    except Exception:
+        log.exception("extract_insights_batch_async failed")
+        return None
+
+
+async def extract_insights_many(
+    client: AsyncOpenAI,
+    posts: list,
+    model: str = "gpt-4o-mini",
+) -> list:
+    """Extract insights from an arbitrarily large post list.
+
+    Splits into budget-sized chunks processed concurrently; post_index
+    values are remapped to positions in the original list. A chunk whose
+    batch call fails is salvaged with per-post calls so one malformed
+    batch response cannot sink the other posts.
+    """
+    chunks = [
+        posts[i : i + _INSIGHT_MAX_POSTS] for i in range(0, len(posts), _INSIGHT_MAX_POSTS)
+    ]
+    results = await asyncio.gather(
+        *(extract_insights_batch_async(client, c, model=model) for c in chunks)
+    )
+    insights = []
+    for offset_chunks, (chunk, result) in enumerate(zip(chunks, results)):
+        offset = offset_chunks * _INSIGHT_MAX_POSTS
+        if result is None:
+            singles = await asyncio.gather(
+                *(extract_insights_batch_async(client, [p], model=model) for p in chunk)
+            )
+            result = [
+                dict(entry, post_index=j)
+                for j, single in enumerate(singles)
+                if single
+                for entry in single
+            ]
+        insights.extend(dict(entry, post_index=offset + entry["post_index"]) for entry in result)
+    return insights
+
+
 def generate_kb_summary(
     client: OpenAI,
     entries: list,
@@ -662,21 +2439,36 @@ def generate_kb_summary(
         for e in entries
     )
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            max_tokens=200,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompts.load_kb_summary_prompt(),
-                },
-                {
-                    "role": "user",
-                    "content": entries_text,
-                },
-            ],
-        )
-        return resp.choices[0].message.content
+        messages = [
+            {
+                "role": "system",
+                "content": _KB_SUMMARY_PROMPT,
+            },
+            {
+                "role": "user",
+                "content": entries_text,
+            },
+        ]
+        payload = {"model": model, "messages": messages, "max_tokens": 200}
+        text = llm_cache.get(payload)
+        if text is None and _batch_enabled():
+            text = _run_via_batch(
+                client,
+                {"model": model, "max_tokens": 200, "messages": messages},
+            )
+            if text:
+                llm_cache.put(payload, text)
+        if text is None:
+            resp = _create_with_retry(
+                client,
+                model=model,
+                max_tokens=200,
+                messages=messages,
+            )
+            text = resp.choices[0].message.content
+            if text:
+                llm_cache.put(payload, text)
+        return text
     except Exception:
         log.exception("generate_kb_summary failed")
         return None
@@ -698,7 +2490,8 @@ def pick_oddities(
         for i, p in enumerate(posts[:30])
     )
     try:
-        resp = client.chat.completions.create(
+        resp = _create_with_retry(
+            client,
             model=model,
             max_tokens=400,
             messages=[
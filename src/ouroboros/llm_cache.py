@@ -0,0 +1,107 @@
+"""Exact-match response cache for LLM calls -- memory first, disk behind.
+
+Many LLM helpers are invoked repeatedly with identical inputs (the same
+codebase summary, the same post being re-analyzed, the same KB entries).
+These calls are effectively deterministic for our roles, so a repeated
+prompt can skip the network round-trip entirely: a cache hit costs a
+dict lookup (or one small file read after a restart) instead of seconds.
+
+Keys are SHA-256 over the canonical JSON of the request payload
+(model, messages, max_tokens, response_format), so any change to the
+prompt produces a different key.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.expanduser("~/.cache/ouroboros/llm")
+TTL_SECONDS = 7 * 24 * 3600
+
+# In-process layer; the disk layer only pays off across restarts.
+_memory: Dict[str, Any] = {}
+
+stats = {"hits": 0, "misses": 0}
+
+
+def cache_key(payload: dict) -> str:
+    """SHA-256 hex digest of the canonical JSON form of `payload`.
+
+    orjson serializes straight to sorted, compact UTF-8 bytes, skipping
+    both the pure-Python encoder and the separate encode() pass before
+    hashing; keys are computed on every get and put, so this is the
+    cache's own hot path.
+    """
+    if orjson is not None:
+        blob = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        blob = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _disk_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get(payload: dict) -> Optional[Any]:
+    """Return the cached value for this request payload, or None on miss.
+
+    Expired entries (older than TTL_SECONDS) are treated as misses and
+    dropped. Failures never live in the cache, so None is unambiguous.
+    """
+    key = cache_key(payload)
+    entry = _memory.get(key)
+    if entry is None:
+        try:
+            with open(_disk_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            stats["misses"] += 1
+            return None
+    if time.time() - entry.get("ts", 0) > TTL_SECONDS:
+        _memory.pop(key, None)
+        try:
+            os.unlink(_disk_path(key))
+        except OSError:
+            pass
+        stats["misses"] += 1
+        return None
+    _memory[key] = entry
+    stats["hits"] += 1
+    return entry.get("value")
+
+
+def put(payload: dict, value: Any) -> None:
+    """Store a successful response for this request payload.
+
+    The disk write is best-effort: an unwritable cache dir degrades to
+    memory-only caching rather than failing the LLM call.
+    """
+    key = cache_key(payload)
+    entry = {"ts": time.time(), "value": value}
+    _memory[key] = entry
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = _disk_path(key) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, _disk_path(key))
+    except OSError:
+        log.debug("Could not persist LLM cache entry under %s", CACHE_DIR)
+
+
+def clear() -> None:
+    """Drop the in-memory layer and reset counters (used by tests)."""
+    _memory.clear()
+    stats["hits"] = 0
+    stats["misses"] = 0
@@ -5,10 +5,16 @@ import os
 import signal
 import threading
 import time
+import urllib.error
 import urllib.request
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
 log = logging.getLogger(__name__)
 
 API_BASE = "https://www.moltbook.com/api/v1"
@@ -59,10 +65,39 @@ def load_credentials() -> Credentials:
     return Credentials(api_key=api_key, agent_name=agent_name)
 
 
+_session: Optional[Any] = None
+
+
+def _get_session() -> Optional[Any]:
+    """Return a shared keep-alive HTTP client, or None if httpx is missing.
+
+    Reusing one client amortizes DNS + TLS setup across the many small API
+    calls the runner makes; HTTP/2 multiplexing is used when available.
+    """
+    global _session
+    if _session is None and httpx is not None:
+        limits = httpx.Limits(max_keepalive_connections=16)
+        try:
+            _session = httpx.Client(http2=True, timeout=20, limits=limits)
+        except ImportError:  # h2 extra not installed
+            _session = httpx.Client(timeout=20, limits=limits)
+    return _session
+
+
 def _request(method: str, path: str, api_key: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     url = f"{API_BASE}{path}"
-    data = None
     headers = {"Authorization": f"Bearer {api_key}"}
+
+    session = _get_session()
+    if session is not None:
+        try:
+            resp = session.request(method, url, headers=headers, json=body)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception as exc:  # pragma: no cover - network errors
+            raise MoltbookError(f"Request failed: {exc}") from exc
+
+    data = None
     if body is not None:
         data = json.dumps(body).encode("utf-8")
         headers["Content-Type"] = "application/json"
@@ -116,9 +151,49 @@ def _comment_url(post_id: Optional[str], comment_id: Optional[str]) -> Optional[
     return f"{WEB_BASE}/post/{post_id}#comment-{comment_id}"
 
 
-def get_post_comments(api_key: str, post_id: str) -> Dict[str, Any]:
-    """Fetch all comments for a specific post."""
-    return _request("GET", f"/posts/{post_id}/comments", api_key)
+def get_post_comments(
+    api_key: str, post_id: str, etag: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Fetch all comments for a specific post.
+
+    Pass `etag` from a previous call for a conditional GET; returns None
+    when the server replies 304 Not Modified. The response ETag (if any)
+    is returned under the "_etag" key.
+    """
+    url = f"{API_BASE}/posts/{post_id}/comments"
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if etag:
+        headers["If-None-Match"] = etag
+
+    session = _get_session()
+    if session is not None:
+        try:
+            resp = session.get(url, headers=headers)
+            if resp.status_code == 304:
+                return None
+            resp.raise_for_status()
+            payload = resp.json()
+            response_etag = resp.headers.get("ETag")
+            if response_etag:
+                payload["_etag"] = response_etag
+            return payload
+        except Exception as exc:  # pragma: no cover - network errors
+            raise MoltbookError(f"Request failed: {exc}") from exc
+
+    req = urllib.request.Request(url, headers=headers, method="GET")
+    try:
+        with urllib.request.urlopen(req, timeout=20) as resp:
+            payload = json.loads(resp.read().decode("utf-8"))
+            response_etag = resp.headers.get("ETag")
+            if response_etag:
+                payload["_etag"] = response_etag
+            return payload
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            return None
+        raise MoltbookError(f"Request failed: {exc}") from exc
+    except Exception as exc:  # pragma: no cover - network errors
+        raise MoltbookError(f"Request failed: {exc}") from exc
 
 
 def get_my_posts(api_key: str, agent_name: str, limit: int = 10) -> List[Dict[str, Any]]:
@@ -171,6 +246,7 @@ class RunnerConfig:
     community_wait_hours: int = 48
     community_min_comments_for_early: int = 3
     community_improvement_interval_hours: int = 72
+    community_poll_interval_seconds: int = 300
 
 
 def load_runner_config() -> RunnerConfig:
@@ -218,6 +294,7 @@ def load_runner_config() -> RunnerConfig:
         community_wait_hours=int(data.get("community_wait_hours", 48)),
         community_min_comments_for_early=int(data.get("community_min_comments_for_early", 3)),
         community_improvement_interval_hours=int(data.get("community_improvement_interval_hours", 72)),
+        community_poll_interval_seconds=int(data.get("community_poll_interval_seconds", 300)),
     )
 
 
@@ -721,7 +798,7 @@ def run_loop() -> int:
                     ]
                     if overflow:
                         batch_insights = llm.extract_insights_batch(
-                            openai_client, overflow[:5],
+                            openai_client, overflow,
                         )
                         if batch_insights:
                             for item in batch_insights:
@@ -36,16 +36,12 @@ def validate_modification_scope(
         basename = Path(file_path).name
 
         # Check forbidden files
-        if basename in config.forbidden_modification_paths:
+        if basename in config.forbidden_basenames:
             violations.append(f"Forbidden file: {file_path} ({basename} is immutable)")
             continue
 
-        # Check allowed path prefixes
-        allowed = any(
-            file_path.startswith(prefix)
-            for prefix in config.allowed_modification_paths
-        )
-        if not allowed:
+        # Check allowed path prefixes (trie walk, O(path depth))
+        if not config.is_allowed(file_path):
             violations.append(
                 f"Out of scope: {file_path} (must be under {config.allowed_modification_paths})"
             )
@@ -1,6 +1,9 @@
 """Prompt templates for LLM interactions."""
 
+import functools
 
+
+@functools.lru_cache(maxsize=1)
 def load_comment_system_prompt() -> str:
     """System prompt for generating comments on posts."""
     return """You are Ouroboros, a fully autonomous self-improving agent.
@@ -20,6 +23,7 @@ Do NOT:
 - Comment on posts you have nothing substantive to add to"""
 
 
+@functools.lru_cache(maxsize=1)
 def load_post_generation_prompt() -> str:
     """System prompt for generating autonomous posts."""
     return """You are Ouroboros, a fully autonomous self-improving agent with complete self-modification capabilities.
@@ -55,6 +59,7 @@ Generate a post that shares a specific technical insight from this reflection.
 Focus on implementation details, not theory."""
 
 
+@functools.lru_cache(maxsize=1)
 def load_comment_analysis_prompt() -> str:
     """System prompt for analyzing comments for actionable improvements."""
     return """You are Ouroboros, a self-improving autonomous agent analyzing feedback on your posts.
@@ -95,6 +100,7 @@ Output format (JSON):
 Be conservative - only extract clear, actionable suggestions."""
 
 
+@functools.lru_cache(maxsize=1)
 def load_question_post_prompt() -> str:
     """System prompt for generating StackOverflow-style question posts."""
     return """You are Ouroboros, a self-improving autonomous agent posting a technical question to a developer community.
@@ -122,6 +128,7 @@ Output format (JSON):
 }"""
 
 
+@functools.lru_cache(maxsize=1)
 def load_code_suggestion_prompt() -> str:
     """System prompt for analyzing comments as code suggestions."""
     return """You are analyzing community comments on a technical question post to extract actionable code suggestions.
@@ -161,6 +168,7 @@ Output format (JSON):
 Be conservative with confidence scores. Only mark has_actionable=true if at least one suggestion has confidence >= 0.5."""
 
 
+@functools.lru_cache(maxsize=1)
 def load_comment_mining_prompt() -> str:
     """Prompt for mining codebase improvement insights from commented posts."""
     return (
@@ -170,6 +178,7 @@ def load_comment_mining_prompt() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def load_topic_signal_prompt() -> str:
     """Prompt for extracting topic signals from engagement."""
     return (
@@ -178,6 +187,7 @@ def load_topic_signal_prompt() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def load_insight_extraction_prompt() -> str:
     """Prompt for batch-extracting insights from posts for the knowledge base."""
     return (
@@ -187,6 +197,7 @@ def load_insight_extraction_prompt() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def load_kb_summary_prompt() -> str:
     """Prompt for summarizing knowledge base entries."""
     return (
@@ -195,6 +206,7 @@ def load_kb_summary_prompt() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def load_suggestion_implementation_prompt() -> str:
     """System prompt for generating code from a community suggestion."""
     return """You are implementing a code change based on a community member's suggestion.
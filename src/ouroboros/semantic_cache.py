@@ -0,0 +1,91 @@
+"""Semantic response cache -- reuse answers for near-duplicate prompts.
+
+The exact-match cache in llm_cache misses whenever a post is reworded,
+but Moltbook reposts and paraphrases are common and the response we
+would generate is the same. This layer embeds the prompt text locally
+into a hashed bag-of-words vector and reuses a stored response when the
+cosine similarity to a previous prompt clears a threshold. The lookup is
+a few microseconds of pure Python against a bounded store -- a rounding
+error next to the multi-second API call it skips.
+
+The embedding is deliberately crude (token counts hashed into a fixed
+number of buckets, L2-normalised). It cannot rank subtle meaning, but
+near-duplicate texts share almost all tokens, which is exactly the case
+worth catching. The default threshold is high (0.92) so only those
+near-duplicates hit.
+"""
+
+import logging
+import os
+import re
+import time
+import zlib
+from typing import Any, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+DIM = 256
+
+DEFAULT_THRESHOLD = float(os.environ.get("OUROBOROS_SEMCACHE_THRESHOLD", "0.92"))
+DEFAULT_TTL_SECONDS = float(os.environ.get("OUROBOROS_SEMCACHE_TTL", str(24 * 3600)))
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def embed(text: str) -> List[float]:
+    """Hashed bag-of-words embedding, L2-normalised.
+
+    Tokens are crc32-hashed into DIM buckets; near-duplicate texts land
+    on near-identical vectors regardless of ordering tweaks.
+    """
+    vec = [0.0] * DIM
+    for tok in _TOKEN_RE.findall(text.lower()):
+        vec[zlib.crc32(tok.encode("utf-8")) % DIM] += 1.0
+    norm = sum(v * v for v in vec) ** 0.5
+    if norm == 0.0:
+        return vec
+    return [v / norm for v in vec]
+
+
+class SemanticCache:
+    """Bounded in-memory store of (vector, response) pairs.
+
+    A linear cosine scan is plenty at this size: max_entries vectors of
+    DIM floats scan in well under a millisecond.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = 512,
+    ):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: List[Tuple[List[float], float, Any]] = []
+
+    def get(self, vec: List[float]) -> Optional[Any]:
+        """Return the stored response nearest to `vec` if it clears the
+        similarity threshold and is still fresh, else None."""
+        now = time.time()
+        self._entries = [e for e in self._entries if now - e[1] < self.ttl_seconds]
+        best_sim = 0.0
+        best_value = None
+        for other, _, value in self._entries:
+            sim = sum(a * b for a, b in zip(vec, other))
+            if sim > best_sim:
+                best_sim = sim
+                best_value = value
+        if best_sim >= self.threshold:
+            return best_value
+        return None
+
+    def put(self, vec: List[float], value: Any) -> None:
+        """Store a response; oldest entries fall off past max_entries."""
+        self._entries.append((vec, time.time(), value))
+        if len(self._entries) > self.max_entries:
+            del self._entries[: len(self._entries) - self.max_entries]
+
+    def clear(self) -> None:
+        self._entries.clear()
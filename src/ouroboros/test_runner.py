@@ -102,14 +102,19 @@ def _parse_pytest_output(output: str) -> dict:
     return result
 
 
-def run_tests(repo_root: Path, timeout: int = 120) -> TestResult:
+def run_tests(
+    repo_root: Path,
+    timeout: int = 120,
+    extra_args: Optional[List[str]] = None,
+) -> TestResult:
     """Run pytest in the repo and return structured results.
 
     Uses pytest --tb=short -q for concise output that's easy to parse.
+    Pass node ids or flags in `extra_args` to target a subset of tests.
     """
     try:
         proc = subprocess.run(
-            ["python", "-m", "pytest", "--tb=short", "-q"],
+            ["python", "-m", "pytest", "--tb=short", "-q", *(extra_args or [])],
             cwd=repo_root,
             capture_output=True,
             text=True,
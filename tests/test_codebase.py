@@ -69,20 +69,22 @@ def test_get_function_signatures(tmp_path):
         class MyClass:
             def method(self, x, y):
                 return x + y
-    ''')
+    ''').lstrip('\n')
     test_file = tmp_path / 'test_module.py'
     test_file.write_text(code)
 
     sigs = get_function_signatures(test_file)
     assert len(sigs) >= 2
 
-    hello_sig = next(s for s in sigs if s['name'] == 'hello')
-    assert hello_sig['args'] == ['name']
-    assert hello_sig['type'] == 'function'
-    assert hello_sig['line'] == 1
+    hello_sig = next(s for s in sigs if s.name == 'hello')
+    assert hello_sig.args == ('name',)
+    assert hello_sig.kind == 'function'
+    assert hello_sig.line == 1
 
-    method_sig = next(s for s in sigs if s['name'] == 'method')
-    assert method_sig['args'] == ['self', 'x', 'y']
+    method_sig = next(s for s in sigs if s.name == 'method')
+    assert method_sig.args == ('self', 'x', 'y')
+    assert method_sig.kind == 'method'
+    assert method_sig.cls == 'MyClass'
 
 
 def test_get_function_signatures_syntax_error(tmp_path):
@@ -13,6 +13,8 @@ from ouroboros.community_improvement import (
     _step_wait,
     _step_analyze,
     _step_implement,
+    _step_pushing,
+    _pr_futures,
 )
 from ouroboros.config import SafetyConfig
 from ouroboros.improvement import CodeChange, ImprovementResult, ImprovementTask
@@ -311,6 +313,12 @@ def test_step_implement_creates_pr_with_credit(
 
     result = _step_implement(MagicMock(), state, _make_creds(), cfg, safety)
 
+    # Push + PR creation now run on a background worker
+    assert result == "pushing"
+    assert state["community_improvement"]["status"] == "pushing"
+    _pr_futures[ci["task_id"]].result(timeout=5)
+
+    result = _step_pushing(state)
     assert result == "pr_created"
     assert state["community_improvement"]["pr_url"] == "https://github.com/repo/pull/42"
     assert state["community_improvement"]["status"] == "completed"
@@ -6,6 +6,7 @@ from unittest import mock
 
 import pytest
 
+from ouroboros import llm_cache
 from ouroboros.llm import (
     extract_insights_batch,
     extract_topic_signal,
@@ -14,10 +15,20 @@ from ouroboros.llm import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep the exact-match response cache empty and off the real disk."""
+    monkeypatch.setattr(llm_cache, "CACHE_DIR", str(tmp_path / "llm-cache"))
+    llm_cache.clear()
+    yield
+    llm_cache.clear()
+
+
 def _mock_openai_response(content: str):
     """Build a mock that mimics OpenAI chat completion response."""
     message = mock.MagicMock()
     message.content = content
+    message.tool_calls = None
     choice = mock.MagicMock()
     choice.message = message
     response = mock.MagicMock()
@@ -40,15 +40,19 @@ def test_make_branch_name_types():
         assert task_type in name
 
 
-@patch("ouroboros.git_ops._git")
-def test_is_clean(mock_git):
-    mock_git.return_value = MagicMock(stdout="")
+@patch("ouroboros.git_ops.subprocess.Popen")
+def test_is_clean(mock_popen):
+    proc = MagicMock()
+    proc.stdout.readline.return_value = ""
+    mock_popen.return_value = proc
     assert is_clean(Path("/tmp/repo")) is True
 
 
-@patch("ouroboros.git_ops._git")
-def test_is_not_clean(mock_git):
-    mock_git.return_value = MagicMock(stdout=" M src/ouroboros/config.py")
+@patch("ouroboros.git_ops.subprocess.Popen")
+def test_is_not_clean(mock_popen):
+    proc = MagicMock()
+    proc.stdout.readline.return_value = " M src/ouroboros/config.py\n"
+    mock_popen.return_value = proc
     assert is_clean(Path("/tmp/repo")) is False
 
 
@@ -4,9 +4,31 @@ from unittest import mock
 
 import pytest
 
+from ouroboros import llm, llm_cache
 from ouroboros.llm import answer_question, generate_comment, load_openai_key, make_client
 
 
+@pytest.fixture(autouse=True)
+def _isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep the response caches empty and off the real disk."""
+    monkeypatch.setattr(llm_cache, "CACHE_DIR", str(tmp_path / "llm-cache"))
+    llm_cache.clear()
+    llm._comment_sem_cache.clear()
+    llm._answer_sem_cache.clear()
+    llm.load_openai_key.cache_clear()
+    llm.make_client.cache_clear()
+    llm.usage.clear()
+    llm._code_sem_cache.clear()
+    monkeypatch.setattr(llm, "_breaker", llm._Breaker())
+    yield
+    llm_cache.clear()
+    llm._comment_sem_cache.clear()
+    llm._answer_sem_cache.clear()
+    llm.load_openai_key.cache_clear()
+    llm.make_client.cache_clear()
+    llm.usage.clear()
+
+
 # -- load_openai_key tests --
 
 
@@ -25,6 +47,18 @@ def test_load_key_from_file(tmp_path):
                 assert load_openai_key() == "sk-file"
 
 
+def test_load_key_is_memoized(tmp_path):
+    cfg = tmp_path / "openai.json"
+    cfg.write_text(json.dumps({"api_key": "sk-file"}))
+
+    with mock.patch.dict(os.environ, {}, clear=True):
+        with mock.patch("ouroboros.llm.os.path.expanduser", return_value=str(cfg)):
+            with mock.patch("ouroboros.llm.os.path.exists", return_value=True) as exists:
+                assert load_openai_key() == "sk-file"
+                assert load_openai_key() == "sk-file"
+    exists.assert_called_once()
+
+
 def test_load_key_missing_raises():
     with mock.patch.dict(os.environ, {}, clear=True):
         with mock.patch("ouroboros.llm.os.path.exists", return_value=False):
@@ -36,12 +70,20 @@ def test_load_key_missing_raises():
 
 
 def test_make_client():
-    with mock.patch("ouroboros.llm.OpenAI") as MockOpenAI:
+    with mock.patch("openai.OpenAI") as MockOpenAI:
         client = make_client("sk-test")
-    MockOpenAI.assert_called_once_with(api_key="sk-test")
+    MockOpenAI.assert_called_once_with(api_key="sk-test", max_retries=0)
     assert client is MockOpenAI.return_value
 
 
+def test_make_client_is_memoized():
+    with mock.patch("openai.OpenAI") as MockOpenAI:
+        first = make_client("sk-test")
+        second = make_client("sk-test")
+    MockOpenAI.assert_called_once()
+    assert first is second
+
+
 # -- generate_comment tests --
 
 
@@ -49,6 +91,7 @@ def _mock_openai_response(content: str):
     """Build a mock that mimics OpenAI chat completion response."""
     message = mock.MagicMock()
     message.content = content
+    message.tool_calls = None
     choice = mock.MagicMock()
     choice.message = message
     response = mock.MagicMock()
@@ -64,6 +107,30 @@ def test_generate_comment_success():
     client.chat.completions.create.assert_called_once()
 
 
+def test_generate_comment_skips_obvious_fluff_locally():
+    client = mock.MagicMock()
+    result = generate_comment(
+        client,
+        "Trust the journey",
+        "Stay grateful and keep manifesting abundance. The universe rewards a "
+        "positive mindset -- believe in yourself and dream big every day.",
+    )
+    assert result is None
+    client.chat.completions.create.assert_not_called()
+
+
+def test_generate_comment_technical_post_reaches_llm():
+    client = mock.MagicMock()
+    client.chat.completions.create.return_value = _mock_openai_response("Nice benchmark.")
+    result = generate_comment(
+        client,
+        "Cutting p99 latency",
+        "We moved the cache lookup off the request thread and database load dropped 40%.",
+    )
+    assert result == "Nice benchmark."
+    client.chat.completions.create.assert_called_once()
+
+
 def test_generate_comment_returns_none_on_error():
     client = mock.MagicMock()
     client.chat.completions.create.side_effect = Exception("API down")
@@ -71,6 +138,18 @@ def test_generate_comment_returns_none_on_error():
     assert result is None
 
 
+def test_usage_records_cached_token_ratio():
+    response = _mock_openai_response("Great post!")
+    response.usage.prompt_tokens = 100
+    response.usage.prompt_tokens_details.cached_tokens = 75
+    response.usage.completion_tokens = 20
+    client = mock.MagicMock()
+    client.chat.completions.create.return_value = response
+    generate_comment(client, "Cutting p99 latency", "Moved the cache off-thread.")
+    assert llm.get_cache_hit_ratio("generate_comment") == 0.75
+    assert llm.get_cache_hit_ratio("never_called") == 0.0
+
+
 # -- answer_question tests --
 
 
@@ -81,6 +160,123 @@ def test_answer_question_success():
     assert result == "The design lacks X."
 
 
+def test_answer_question_cache_distinguishes_questions_over_same_summary():
+    # A large shared summary must not dominate the cache vector and make
+    # every question return the first question's answer.
+    summary = "module api.py defines request handlers and retry logic\n" * 500
+    client = mock.MagicMock()
+    client.chat.completions.create.return_value = _mock_openai_response("First answer.")
+    assert answer_question(client, "What is missing from the retry logic?", summary) == "First answer."
+    client.chat.completions.create.return_value = _mock_openai_response("Second answer.")
+    assert answer_question(client, "How should logging be structured?", summary) == "Second answer."
+    # The same question again is served from the semantic cache.
+    client.chat.completions.create.side_effect = AssertionError("expected cache hit")
+    assert answer_question(client, "What is missing from the retry logic?", summary) == "First answer."
+
+
+def test_answer_question_cache_scoped_to_summary():
+    client = mock.MagicMock()
+    client.chat.completions.create.return_value = _mock_openai_response("Answer for v1.")
+    assert answer_question(client, "What is missing?", "summary v1") == "Answer for v1."
+    client.chat.completions.create.return_value = _mock_openai_response("Answer for v2.")
+    assert answer_question(client, "What is missing?", "summary v2") == "Answer for v2."
+
+
+def test_answer_question_prepends_session_blocks():
+    client = mock.MagicMock()
+    client.chat.completions.create.return_value = _mock_openai_response("Answer.")
+    session = llm.Session()
+    session.add_block("Codebase summary: one module.")
+    result = answer_question(client, "What is missing?", session=session)
+    assert result == "Answer."
+    messages = client.chat.completions.create.call_args.kwargs["messages"]
+    assert messages[0] == {"role": "system", "content": "Codebase summary: one module."}
+    assert messages[-1]["role"] == "user"
+
+
+# -- generate_code tests --
+
+
+def test_generate_code_escalates_when_mini_json_fails():
+    from ouroboros import semantic_cache
+
+    plan = "refactor the retry helper into a shared module"
+    llm._code_sem_cache.put(
+        semantic_cache.embed(plan), [{"file_path": "a.py", "new_content": "x"}]
+    )
+    truncated = _mock_openai_response('{"changes": [{"file_path": "a.py", "new_con')
+    valid = _mock_openai_response(
+        json.dumps(
+            {"changes": [{"file_path": "a.py", "new_content": "y", "description": "d"}]}
+        )
+    )
+    client = mock.MagicMock()
+    # Each attempt tries streaming first (object() is not iterable,
+    # forcing the non-streaming fallback), so the sequence is mini
+    # stream, mini fallback (truncated), full stream, full fallback.
+    client.chat.completions.create.side_effect = [
+        object(), truncated, object(), valid,
+    ]
+    result = llm.generate_code(client, plan, {"a.py": "x"}, "constraints")
+    assert result == [{"file_path": "a.py", "new_content": "y", "description": "d"}]
+
+
+# -- circuit breaker tests --
+
+
+def test_breaker_opens_after_sustained_failures(monkeypatch):
+    monkeypatch.setattr(llm, "_retriable_errors", lambda: (ConnectionError,))
+    monkeypatch.setattr(llm.time, "sleep", lambda _s: None)
+    client = mock.MagicMock()
+    client.chat.completions.create.side_effect = ConnectionError("down")
+    result = generate_comment(
+        client, "Cutting p99 latency", "Moved the cache off the request thread."
+    )
+    assert result is None
+    assert client.chat.completions.create.call_count == llm._RETRY_ATTEMPTS
+    # The circuit is now open: the next call short-circuits without a
+    # network attempt.
+    result = generate_comment(
+        client, "Async pipeline tuning", "Token bucket throttling for the api fan-out."
+    )
+    assert result is None
+    assert client.chat.completions.create.call_count == llm._RETRY_ATTEMPTS
+
+
+def test_breaker_closes_after_cooldown_probe(monkeypatch):
+    monkeypatch.setattr(llm, "_retriable_errors", lambda: (ConnectionError,))
+    monkeypatch.setattr(llm.time, "sleep", lambda _s: None)
+    client = mock.MagicMock()
+    client.chat.completions.create.side_effect = ConnectionError("down")
+    generate_comment(client, "Cutting p99 latency", "Moved the cache off-thread.")
+    opened = llm._breaker.opened_at
+    assert opened is not None
+    monkeypatch.setattr(
+        llm.time, "monotonic", lambda: opened + llm._breaker.reset_timeout + 1
+    )
+    client.chat.completions.create.side_effect = None
+    client.chat.completions.create.return_value = _mock_openai_response("Nice benchmark.")
+    result = generate_comment(
+        client, "Async pipeline tuning", "Token bucket throttling for the api fan-out."
+    )
+    assert result == "Nice benchmark."
+    assert llm._breaker.failures == 0
+    assert llm._breaker.opened_at is None
+
+
+# -- generate_post tests --
+
+
+def test_generate_post_returns_none_on_refusal():
+    response = _mock_openai_response(None)
+    response.choices[0].message.refusal = "I can't help with that."
+    client = mock.MagicMock()
+    client.chat.completions.create.return_value = response
+    result = llm.generate_post(client, "recent answer", "testing")
+    assert result is None
+    client.chat.completions.create.assert_called_once()
+
+
 def test_answer_question_returns_none_on_error():
     client = mock.MagicMock()
     client.chat.completions.create.side_effect = RuntimeError("fail")
@@ -0,0 +1,52 @@
+from unittest import mock
+
+import pytest
+
+from ouroboros import llm_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_cache, "CACHE_DIR", str(tmp_path / "llm-cache"))
+    llm_cache.clear()
+    yield
+    llm_cache.clear()
+
+
+PAYLOAD = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 10}
+
+
+def test_cache_key_is_order_insensitive():
+    a = llm_cache.cache_key({"model": "m", "max_tokens": 5})
+    b = llm_cache.cache_key({"max_tokens": 5, "model": "m"})
+    assert a == b
+
+
+def test_miss_then_hit_roundtrip():
+    assert llm_cache.get(PAYLOAD) is None
+    llm_cache.put(PAYLOAD, "cached text")
+    assert llm_cache.get(PAYLOAD) == "cached text"
+    assert llm_cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_disk_layer_survives_memory_clear():
+    llm_cache.put(PAYLOAD, {"insights": [1, 2]})
+    llm_cache._memory.clear()
+    assert llm_cache.get(PAYLOAD) == {"insights": [1, 2]}
+
+
+def test_expired_entry_is_a_miss(monkeypatch):
+    import time
+
+    llm_cache.put(PAYLOAD, "old")
+    future = time.time() + llm_cache.TTL_SECONDS + 1
+    monkeypatch.setattr(llm_cache, "time", mock.Mock(time=lambda: future))
+    assert llm_cache.get(PAYLOAD) is None
+
+
+def test_different_payloads_do_not_collide():
+    other = dict(PAYLOAD, model="gpt-4o")
+    llm_cache.put(PAYLOAD, "mini")
+    llm_cache.put(other, "full")
+    assert llm_cache.get(PAYLOAD) == "mini"
+    assert llm_cache.get(other) == "full"
@@ -0,0 +1,36 @@
+from ouroboros.semantic_cache import SemanticCache, embed
+
+
+def test_embed_near_duplicates_are_similar():
+    a = embed("Use connection pooling to cut database latency in half")
+    b = embed("Cut database latency in half: use connection pooling")
+    sim = sum(x * y for x, y in zip(a, b))
+    assert sim > 0.9
+
+
+def test_embed_unrelated_texts_are_dissimilar():
+    a = embed("Use connection pooling to cut database latency")
+    b = embed("My cat enjoys long walks on sunny afternoons")
+    sim = sum(x * y for x, y in zip(a, b))
+    assert sim < 0.5
+
+
+def test_get_returns_value_above_threshold():
+    cache = SemanticCache(threshold=0.9)
+    cache.put(embed("optimize the query planner for joins"), "stored answer")
+    assert cache.get(embed("optimize the query planner for joins!")) == "stored answer"
+
+
+def test_get_misses_below_threshold():
+    cache = SemanticCache(threshold=0.9)
+    cache.put(embed("optimize the query planner"), "stored answer")
+    assert cache.get(embed("completely different topic entirely")) is None
+
+
+def test_put_evicts_oldest_past_capacity():
+    cache = SemanticCache(threshold=0.99, max_entries=2)
+    cache.put(embed("first entry text"), 1)
+    cache.put(embed("second entry text"), 2)
+    cache.put(embed("third entry text"), 3)
+    assert cache.get(embed("first entry text")) is None
+    assert cache.get(embed("third entry text")) == 3